@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Accumulate the last N frames into one de-skewed point cloud without reallocating.
+
+Points of one Carbon frame are measured over the frame period; each point's
+nanosecs_since_frame says when. FrameAccumulator moves every point back to its
+frame timestamp along its line of sight using its radial velocity
+(p - v_r * dt * p / |p|), then stores it in a ring buffer preallocated for
+--capacity-points points:
+  - acc.points()        read-only (N, 4) view of x, y, z, radial velocity of
+                        all accumulated frames, oldest first, without copying
+  - acc.aligned(t)      x, y, z of all points moved to one common time t along
+                        their line of sight, written into a reused buffer
+
+The ring is stored twice back to back (a mirrored ring buffer), so the live
+window is always one contiguous slice and points() never copies. In steady
+state no arrays are allocated apart from the frame data itself.
+
+The correction only accounts for each point's own radial motion and assumes a
+static sensor and positive radial velocity for points moving away.
+
+Example usage:
+    python accumulator_example.py --input recording.vynt --frames 10
+    python accumulator_example.py --input recording.vynt --frames 5 --capacity-points 200000
+"""
+
+import argparse
+import collections
+
+import numpy as np
+from voyant_api import VoyantPlayback, init_voyant_logging
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Accumulate the last N frames into one de-skewed point cloud",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        required=True,
+        help="Path to the Voyant recording file (.vynt or .bin)",
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=10,
+        help="Number of most recent frames kept",
+    )
+    parser.add_argument(
+        "--capacity-points",
+        type=int,
+        default=500_000,
+        help="Points preallocated for the whole window; older frames are dropped to fit",
+    )
+    return parser.parse_args()
+
+
+class FrameAccumulator:
+    """Ring buffer of the last N frames' de-skewed points in preallocated arrays."""
+
+    def __init__(self, n_frames, capacity_points):
+        """
+        Args:
+            n_frames: Maximum number of frames kept
+            capacity_points: Maximum number of points kept across all frames
+        """
+        self.n_frames = n_frames
+        self.capacity = capacity_points
+        # Every ring array holds two copies of the ring back to back.
+        self._xyzv = np.zeros((2 * capacity_points, 4), dtype=np.float32)
+        self._los_vel = np.zeros((2 * capacity_points, 3), dtype=np.float32)
+        self._time = np.zeros(2 * capacity_points, dtype=np.float64)
+
+        # Scratch space for one incoming frame and for aligned().
+        self._stage_xyzv = np.empty((capacity_points, 4), dtype=np.float32)
+        self._stage_los = np.empty((capacity_points, 3), dtype=np.float32)
+        self._stage_tmp = np.empty((capacity_points, 3), dtype=np.float32)
+        self._stage_r = np.empty(capacity_points, dtype=np.float32)
+        self._stage_dt = np.empty(capacity_points, dtype=np.float32)
+        self._aligned = np.empty((capacity_points, 3), dtype=np.float32)
+
+        # (frame_index, timestamp, n_points) of every frame in the window.
+        self._frames = collections.deque()
+        self._start = 0
+        self._n_points = 0
+
+    def __len__(self):
+        return self._n_points
+
+    @property
+    def frame_indices(self):
+        return [frame_index for frame_index, _, _ in self._frames]
+
+    @property
+    def newest_timestamp(self):
+        return self._frames[-1][1] if self._frames else None
+
+    def add_frame(self, frame):
+        """De-skew a VoyantFrame and add it, dropping the oldest frames as needed."""
+        # Column views into the frame's own array; add() copies them into the
+        # preallocated staging buffers. Columns 0-3 are x, y, z, radial_vel
+        # and column 5 is nanosecs_since_frame (see VoyantFrame.points_columns).
+        points = frame.valid_points()
+        self.add(points[:, :4], points[:, 5], frame.timestamp, frame.frame_index)
+
+    def add(self, xyzv, nanosecs_since_frame, timestamp, frame_index=None):
+        """De-skew one frame's points to its timestamp and add them.
+
+        Args:
+            xyzv: (n, 4) array of x, y, z, radial velocity
+            nanosecs_since_frame: (n,) time of each point after the frame timestamp
+            timestamp: Frame timestamp (seconds)
+            frame_index: Sensor frame index, kept for bookkeeping
+        """
+        n = len(xyzv)
+        if n > self.capacity:
+            raise ValueError(
+                f"frame has {n} points, more than the capacity of {self.capacity}"
+            )
+
+        stage = self._stage_xyzv[:n]
+        xyz = stage[:, :3]
+        los = self._stage_los[:n]
+        tmp = self._stage_tmp[:n]
+        r = self._stage_r[:n]
+        dt = self._stage_dt[:n]
+        np.copyto(stage, xyzv, casting="same_kind")
+
+        # Line-of-sight velocity vector: radial velocity times the unit vector.
+        np.multiply(xyz, xyz, out=tmp)
+        np.sum(tmp, axis=1, out=r)
+        np.sqrt(r, out=r)
+        np.maximum(r, np.float32(1e-6), out=r)
+        np.divide(stage[:, 3], r, out=r)
+        np.multiply(xyz, r[:, None], out=los)
+
+        # Move every point back to the frame timestamp.
+        np.multiply(nanosecs_since_frame, 1e-9, out=dt, casting="same_kind")
+        np.multiply(los, dt[:, None], out=tmp)
+        np.subtract(xyz, tmp, out=xyz)
+
+        while self._frames and (
+            len(self._frames) >= self.n_frames or self._n_points + n > self.capacity
+        ):
+            _, _, dropped = self._frames.popleft()
+            self._start = (self._start + dropped) % self.capacity
+            self._n_points -= dropped
+
+        head = (self._start + self._n_points) % self.capacity
+        self._write(self._xyzv, head, n, stage)
+        self._write(self._los_vel, head, n, los)
+        self._write(self._time, head, n, timestamp)
+        self._frames.append((frame_index, timestamp, n))
+        self._n_points += n
+
+    def _write(self, ring, head, n, values):
+        """Write n values (an array, or a scalar for all) at head in both copies."""
+        first = min(n, self.capacity - head)
+        rest = n - first
+        if np.ndim(values):
+            values_first, values_rest = values[:first], values[first:]
+        else:
+            values_first = values_rest = values
+        ring[head : head + first] = values_first
+        ring[head + self.capacity : head + self.capacity + first] = values_first
+        if rest:
+            ring[:rest] = values_rest
+            ring[self.capacity : self.capacity + rest] = values_rest
+
+    def points(self):
+        """Read-only (N, 4) view of all accumulated points, oldest frame first."""
+        view = self._xyzv[self._start : self._start + self._n_points]
+        view.flags.writeable = False
+        return view
+
+    def timestamps(self):
+        """Read-only (N,) view of the frame timestamp of every accumulated point."""
+        view = self._time[self._start : self._start + self._n_points]
+        view.flags.writeable = False
+        return view
+
+    def aligned(self, t_ref=None):
+        """x, y, z of all points moved to time t_ref along their line of sight.
+
+        Args:
+            t_ref: Common time (seconds); defaults to the newest frame timestamp
+
+        Returns:
+            (N, 3) view of a buffer reused by the next call
+        """
+        if t_ref is None:
+            t_ref = self.newest_timestamp
+        n = self._n_points
+        window = slice(self._start, self._start + n)
+        out = self._aligned[:n]
+        dt = self._stage_dt[:n]
+        np.subtract(t_ref, self._time[window], out=dt, casting="same_kind")
+        np.multiply(self._los_vel[window], dt[:, None], out=out)
+        np.add(out, self._xyzv[window, :3], out=out)
+        return out
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    accumulator = FrameAccumulator(args.frames, args.capacity_points)
+
+    with VoyantPlayback() as playback:
+        playback.open(args.input)
+        for frame in playback:
+            if frame is None:
+                break
+
+            accumulator.add_frame(frame)
+            cloud = accumulator.aligned()
+            print(
+                f"Frame {frame.frame_index}: window of {len(accumulator.frame_indices)} "
+                f"frames, {len(accumulator)} points, "
+                f"centroid {np.round(cloud.mean(axis=0), 2) if len(cloud) else None}"
+            )
+
+            ###############################################
+            # Insert your point cloud processing magic here
+            ###############################################
+
+
+if __name__ == "__main__":
+    main()
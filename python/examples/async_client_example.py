@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Receive live Voyant data with a blocking or asyncio consumer instead of
+polling in application code.
+
+CarbonClient only offers the non-blocking try_receive_frame(), so the other
+examples spin on it with a 1 ms sleep. FrameReceiver is a polling adapter: a
+single background thread still polls try_receive_frame(), backing off from
+0.1 ms up to 2 ms while no frame is queued, and hands frames over a queue:
+  - receiver.receive_frame(timeout=...) blocks the caller until a frame arrives.
+  - `async for frame in receiver.frames()` awaits frames on an asyncio loop. The
+    receiver thread wakes the loop through its self-pipe (call_soon_threadsafe),
+    so frames can be awaited alongside any other I/O.
+
+The queue between the receiver thread and the consumer can be bounded, with
+an overflow policy chosen per service: keep-latest for low-latency perception,
+keep-all (up to the capacity) for recording. Both are set with
+--queue-capacity and --overflow. Dropped frames are counted and reported.
+
+--queue-capacity also bounds the client's own receive channel through
+CarbonConfig.set_receiver_channel_capacity(). In a device config JSON the same
+setting is the receiver.channel_capacity key:
+    {"receiver": {"channel_capacity": 4, "multicast": {...}}}
+The flag, when given, overrides the value from --config.
+
+Pass --sim to target a local carbon_simulator on loopback, like the C++
+carbon_client_basic example.
+
+Example usage:
+    python async_client_example.py
+    python async_client_example.py --sim --mode blocking
+    python async_client_example.py --queue-capacity 1 --overflow keep-latest
+"""
+
+import argparse
+import asyncio
+import collections
+import threading
+import time
+
+from voyant_api import CarbonClient, CarbonConfig, init_voyant_logging
+
+# The receiver thread sleeps between empty polls, doubling the interval from
+# the minimum to the maximum while the client stays idle. A frame resets it, so
+# a busy stream is polled quickly and an idle one wakes at most 500 times/s.
+# Only this one thread ever sleeps; consumers block on the queue instead.
+MIN_POLL_INTERVAL_SEC = 0.0001
+MAX_POLL_INTERVAL_SEC = 0.002
+
+OVERFLOW_POLICIES = ("keep-latest", "keep-all")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Receive live Voyant data with a blocking or asyncio consumer",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        metavar="PATH",
+        help=(
+            "Path to a JSON device config (e.g. config/device_config.json "
+            "with your sensor interface_addr). "
+            "If omitted, default CarbonConfig values are used."
+        ),
+    )
+    parser.add_argument(
+        "--sim",
+        action="store_true",
+        help="Point at a local carbon_simulator on loopback.",
+    )
+    parser.add_argument(
+        "--queue-capacity",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Frames buffered for the consumer; also sets the client's "
+            "receiver channel capacity. Unbounded if omitted."
+        ),
+    )
+    parser.add_argument(
+        "--overflow",
+        choices=OVERFLOW_POLICIES,
+        default="keep-all",
+        help="Which frame is dropped when the queue is full",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=("async", "blocking"),
+        default="async",
+        help="Consume frames with an asyncio iterator or a blocking receive.",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=1.0,
+        metavar="SEC",
+        help="Receive timeout in seconds (blocking mode).",
+    )
+    args = parser.parse_args()
+    if args.queue_capacity is not None and args.queue_capacity < 1:
+        parser.error("--queue-capacity must be at least 1")
+    return args
+
+
+class FrameReceiver:
+    """Polling adapter: owns the try_receive_frame() poll on a background thread.
+
+    Frames are handed to consumers through a queue, so callers can block on
+    receive_frame() or await frames() rather than polling the client themselves.
+
+    The queue holds at most `capacity` frames (None for no limit). When a new
+    frame arrives at a full queue, `overflow` decides which frame is lost:
+      - "keep-latest": the oldest queued frame is dropped (low-latency consumers;
+        capacity=1 always hands over the newest frame)
+      - "keep-all":    the new frame is dropped, so the frames already queued
+        reach the consumer in full (recording)
+    Every dropped frame is counted in frames_dropped.
+    """
+
+    def __init__(self, client: CarbonClient, capacity=None, overflow="keep-all"):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy {overflow!r}; available: {OVERFLOW_POLICIES}"
+            )
+        if capacity is not None and capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self._client = client
+        self._capacity = capacity
+        self._overflow = overflow
+        self._queue = collections.deque()
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="voyant-frame-receiver", daemon=True
+        )
+        self.frames_received = 0
+        self.frames_dropped = 0
+        self.max_queue_depth = 0
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        interval = MIN_POLL_INTERVAL_SEC
+        while not self._stop.is_set() and self._client.is_running():
+            frame = self._client.try_receive_frame()
+            if frame is None:
+                time.sleep(interval)
+                interval = min(2 * interval, MAX_POLL_INTERVAL_SEC)
+                continue
+            interval = MIN_POLL_INTERVAL_SEC
+            with self._lock:
+                self.frames_received += 1
+            self._deliver(frame)
+        # Wake any consumer still waiting so it can observe shutdown.
+        self._deliver(None)
+
+    def _offer(self, frames, frame):
+        """Append to a queue under the overflow policy. Called with self._lock held.
+
+        `frames` is a deque or an unbounded asyncio.Queue; capacity is enforced
+        here so the shutdown marker (None) is never dropped.
+        """
+        depth = len(frames) if isinstance(frames, collections.deque) else frames.qsize()
+        if frame is not None and self._capacity is not None and depth >= self._capacity:
+            self.frames_dropped += 1
+            if self._overflow == "keep-all":
+                return
+            if isinstance(frames, collections.deque):
+                frames.popleft()
+            else:
+                frames.get_nowait()
+            depth -= 1
+        if isinstance(frames, collections.deque):
+            frames.append(frame)
+        else:
+            frames.put_nowait(frame)
+        if frame is not None:
+            self.max_queue_depth = max(self.max_queue_depth, depth + 1)
+
+    def _offer_async(self, frame_queue, frame):
+        with self._lock:
+            self._offer(frame_queue, frame)
+
+    def _deliver(self, frame):
+        with self._lock:
+            subscribers = list(self._subscribers)
+            if not subscribers:
+                self._offer(self._queue, frame)
+                self._not_empty.notify()
+        for entry in subscribers:
+            loop, frame_queue = entry
+            # call_soon_threadsafe writes to the loop's wakeup fd, so the
+            # awaiting coroutine resumes without the loop polling.
+            try:
+                loop.call_soon_threadsafe(self._offer_async, frame_queue, frame)
+            except RuntimeError:
+                # The loop was closed (e.g. asyncio.run returned) before the
+                # subscriber's finally block ran; nobody is left to read it.
+                with self._lock:
+                    if entry in self._subscribers:
+                        self._subscribers.remove(entry)
+
+    @property
+    def queue_depth(self):
+        with self._lock:
+            return len(self._queue) + sum(q.qsize() for _, q in self._subscribers)
+
+    def receive_frame(self, timeout=None):
+        """Block until a frame arrives.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            VoyantFrame, or None on timeout or once the client has stopped
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: self._queue, timeout=timeout):
+                return None
+            return self._queue.popleft()
+
+    async def frames(self):
+        """Asynchronously iterate over frames until the client stops."""
+        loop = asyncio.get_running_loop()
+        frame_queue = asyncio.Queue()
+        entry = (loop, frame_queue)
+        with self._lock:
+            self._subscribers.append(entry)
+            # Anything that arrived before we subscribed is handed over first.
+            while self._queue:
+                frame_queue.put_nowait(self._queue.popleft())
+        try:
+            while True:
+                frame = await frame_queue.get()
+                if frame is None:
+                    return
+                yield frame
+        finally:
+            with self._lock:
+                self._subscribers.remove(entry)
+
+
+async def consume_async(receiver):
+    frame_count = 0
+    async for frame in receiver.frames():
+        frame_count += 1
+        print(f"Frame {frame_count}: {frame}")
+
+        ###############################################
+        # Insert your point cloud processing magic here
+        # (other coroutines keep running between frames)
+        ###############################################
+    return frame_count
+
+
+def consume_blocking(receiver, client, timeout):
+    frame_count = 0
+    while client.is_running():
+        frame = receiver.receive_frame(timeout=timeout)
+        if frame is None:
+            print(f"No frame received within {timeout} s")
+            continue
+        frame_count += 1
+        print(f"Frame {frame_count}: {frame}")
+
+        ###############################################
+        # Insert your point cloud processing magic here
+        ###############################################
+    return frame_count
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    config = CarbonConfig.from_json(args.config) if args.config else CarbonConfig()
+    if args.sim:
+        # Point at the local carbon_simulator on loopback.
+        config.set_interface_addr("127.0.0.1")
+        config.set_fpga_target_addr("127.0.0.1:1234")
+    if args.queue_capacity is not None:
+        # Same setting as receiver.channel_capacity in the device config JSON.
+        config.set_receiver_channel_capacity(args.queue_capacity)
+    print("Using config:")
+    print(config)
+    print()
+
+    print("Starting CarbonClient...")
+    print("Press Ctrl+C to stop\n")
+
+    capacity = "unbounded" if args.queue_capacity is None else args.queue_capacity
+    print(f"Frame queue: capacity {capacity}, overflow {args.overflow}\n")
+
+    client = CarbonClient(config)
+    client.start()
+    receiver = FrameReceiver(client, args.queue_capacity, args.overflow)
+    receiver.start()
+
+    try:
+        if args.mode == "async":
+            asyncio.run(consume_async(receiver))
+        else:
+            consume_blocking(receiver, client, args.timeout)
+    except KeyboardInterrupt:
+        print("\nStopping...")
+    finally:
+        client.stop()
+        receiver.stop()
+        print(
+            f"Received {receiver.frames_received} frames, "
+            f"dropped {receiver.frames_dropped} on queue overflow "
+            f"(queue high-water {receiver.max_queue_depth})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Receive live Voyant data and record it from a background writer thread.
+
+In recorder_example.py, VoyantRecorder.record_frame() runs on the receive loop,
+so any disk stall delays the next try_receive_frame() and frames get dropped
+by the client. BackgroundRecorder moves record_frame() onto a writer thread fed
+by a bounded queue. When the queue is full the --backpressure policy decides:
+  - block:       the receive loop waits for space (no frame is lost here)
+  - drop-oldest: the oldest queued frame is discarded to make room
+  - drop-newest: the incoming frame is discarded
+
+RecordStatus.SPLIT and RecordStatus.STOP are reported back to the receive loop,
+so the per-file and total limits work exactly as in recorder_example.py.
+
+Example usage:
+    python background_recorder_example.py --output recording.vynt
+    python background_recorder_example.py --output recording.vynt --queue-size 64 --backpressure drop-oldest
+"""
+
+import argparse
+import collections
+import threading
+import time
+
+from voyant_api import CarbonClient, CarbonConfig
+from voyant_api import VoyantRecorder
+from voyant_api import RecordStatus
+from voyant_api import init_voyant_logging
+
+BACKPRESSURE_POLICIES = ("block", "drop-oldest", "drop-newest")
+
+
+def parse_args():
+    """Parse command-line arguments for the recording script."""
+    parser = argparse.ArgumentParser(
+        description="Receive and record live Voyant data from a background thread",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+
+    # --- Required Arguments ---
+    parser.add_argument(
+        "--output",
+        type=str,
+        required=True,
+        help="Base path for the output recording file (.vynt or .bin)",
+    )
+
+    # --- Network Configuration ---
+    parser.add_argument(
+        "--config",
+        type=str,
+        metavar="PATH",
+        help=(
+            "Path to a JSON device config (e.g. config/device_config.json "
+            "with your sensor interface_addr). "
+            "If omitted, default CarbonConfig values are used."
+        ),
+    )
+
+    # --- Queue Configuration ---
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=32,
+        help="Maximum number of frames waiting for the writer thread",
+    )
+    parser.add_argument(
+        "--backpressure",
+        choices=BACKPRESSURE_POLICIES,
+        default="block",
+        help="What to do with a new frame when the queue is full",
+    )
+
+    # --- Recording Configuration ---
+    parser.add_argument(
+        "--frames-per-file",
+        type=int,
+        default=None,
+        help="Maximum frames per file before splitting (None = no limit)",
+    )
+    parser.add_argument(
+        "--duration-per-file",
+        type=int,
+        default=None,
+        help="Maximum seconds per file before splitting (None = no limit)",
+    )
+    parser.add_argument(
+        "--size-per-file-mb",
+        type=int,
+        default=None,
+        help="Maximum MB per file before splitting (None = no limit)",
+    )
+    parser.add_argument(
+        "--max-total-frames",
+        type=int,
+        default=None,
+        help="Maximum total frames across all files (None = no limit)",
+    )
+    parser.add_argument(
+        "--max-total-duration",
+        type=int,
+        default=None,
+        help="Maximum total seconds across all files (None = no limit)",
+    )
+    parser.add_argument(
+        "--max-total-size-mb",
+        type=int,
+        default=None,
+        help="Maximum total MB across all files (None = no limit)",
+    )
+    parser.add_argument(
+        "--no-timestamp-filename",
+        dest="timestamp_filename",
+        action="store_false",
+        help="If set, disables adding a timestamp to the output filename",
+    )
+
+    # Set default for timestamp_filename to True, action='store_false' makes it False when flag is present
+    parser.set_defaults(timestamp_filename=True)
+
+    return parser.parse_args()
+
+
+class BackgroundRecorder:
+    """Runs VoyantRecorder.record_frame() on a writer thread behind a bounded queue."""
+
+    def __init__(self, recorder: VoyantRecorder, queue_size=32, backpressure="block"):
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"Unknown backpressure policy {backpressure!r}; "
+                f"available: {BACKPRESSURE_POLICIES}"
+            )
+        self._recorder = recorder
+        self._queue_size = queue_size
+        self._backpressure = backpressure
+        self._queue = collections.deque()
+        self._cond = threading.Condition()
+        self._closing = False
+
+        # Status reported back to the receive loop. A split is reported once.
+        self._stopped = False
+        self._failure = None
+        self._pending_splits = 0
+
+        # Counters
+        self.frames_queued = 0
+        self.frames_dropped = 0
+        self.frames_written = 0
+        self.max_queue_depth = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name="voyant-recorder-writer", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def queue_depth(self):
+        with self._cond:
+            return len(self._queue)
+
+    @property
+    def frames_recorded(self):
+        return self._recorder.frames_recorded
+
+    @property
+    def split_count(self):
+        return self._recorder.split_count
+
+    def record_frame(self, frame) -> RecordStatus:
+        """Queue a frame for the writer thread.
+
+        Returns:
+            RecordStatus.STOP once the recorder has reached its limits,
+            RecordStatus.SPLIT once for every file split since the last call,
+            RecordStatus.OK otherwise. Like VoyantRecorder.record_frame(), but the
+            status may lag the frame that caused it by the queue depth.
+
+        Raises:
+            RuntimeError: If the writer thread failed to record a frame.
+        """
+        with self._cond:
+            if self._stopped:
+                return self._take_status()
+
+            if len(self._queue) >= self._queue_size:
+                if self._backpressure == "block":
+                    self._cond.wait_for(
+                        lambda: len(self._queue) < self._queue_size or self._stopped
+                    )
+                elif self._backpressure == "drop-oldest":
+                    self._queue.popleft()
+                    self.frames_dropped += 1
+                else:
+                    self.frames_dropped += 1
+                    return self._take_status()
+
+            if not self._stopped:
+                self._queue.append(frame)
+                self.frames_queued += 1
+                self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+                self._cond.notify_all()
+            return self._take_status()
+
+    def _take_status(self):
+        # Called with self._cond held.
+        if self._failure is not None:
+            raise RuntimeError(f"Background recording failed: {self._failure}")
+        if self._stopped:
+            return RecordStatus.STOP
+        if self._pending_splits:
+            self._pending_splits -= 1
+            return RecordStatus.SPLIT
+        return RecordStatus.OK
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closing)
+                if not self._queue:
+                    return
+                frame = self._queue.popleft()
+                self._cond.notify_all()
+
+            try:
+                status = self._recorder.record_frame(frame)
+            except Exception as exc:
+                status = exc
+
+            with self._cond:
+                if status == RecordStatus.OK:
+                    self.frames_written += 1
+                elif status == RecordStatus.SPLIT:
+                    self.frames_written += 1
+                    self._pending_splits += 1
+                else:
+                    if status == RecordStatus.STOP:
+                        # The frame that reached the limit is still written.
+                        self.frames_written += 1
+                    else:
+                        self._failure = status
+                    self._stopped = True
+                    # Nothing more will be written; release any blocked producer.
+                    self.frames_dropped += len(self._queue)
+                    self._queue.clear()
+                    self._cond.notify_all()
+                    return
+
+    def finalize(self):
+        """Write out every queued frame, then finalize the recorder."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._recorder.finalize()
+
+
+def main():
+    """Main function to set up client and recorder and run the recording loop."""
+    init_voyant_logging()
+
+    args = parse_args()
+
+    # 1. Create the client to receive frames from the network
+    config = CarbonConfig.from_json(args.config) if args.config else CarbonConfig()
+    print("Using config:")
+    print(config)
+    print()
+
+    client = CarbonClient(config)
+    client.start()
+
+    # 2. Create the recorder and hand it to the background writer thread
+    recorder = BackgroundRecorder(
+        VoyantRecorder(
+            output_path=args.output,
+            timestamp_filename=args.timestamp_filename,
+            frames_per_file=args.frames_per_file,
+            duration_per_file=args.duration_per_file,
+            size_per_file_mb=args.size_per_file_mb,
+            max_total_frames=args.max_total_frames,
+            max_total_duration=args.max_total_duration,
+            max_total_size_mb=args.max_total_size_mb,
+        ),
+        queue_size=args.queue_size,
+        backpressure=args.backpressure,
+    )
+
+    print(f"Recording to '{args.output}'. Press Ctrl+C to stop.")
+
+    try:
+        # 3. Run the main receive loop; record_frame() only enqueues
+        while client.is_running():
+            frame = client.try_receive_frame()
+            if frame is not None:
+                ###############################################
+                # Insert your point cloud processing magic here
+                ###############################################
+
+                status = recorder.record_frame(frame)
+
+                if status == RecordStatus.STOP:
+                    print("\nRecording limit reached. Finalizing...")
+                    break  # Stop the loop as the recording limit was hit
+
+                elif status == RecordStatus.SPLIT:
+                    print("File split due to limit")  # Log that a new file was created
+
+                # Periodically print progress and queue health
+                queued = recorder.frames_queued
+                if queued > 0 and queued % 100 == 0:
+                    print(
+                        f"Recorded {recorder.frames_written}/{queued} queued frames "
+                        f"in {recorder.split_count} files "
+                        f"(depth {recorder.queue_depth}, "
+                        f"high-water {recorder.max_queue_depth}, "
+                        f"dropped {recorder.frames_dropped})"
+                    )
+
+            else:
+                # No frame available yet, sleep briefly to avoid a busy loop
+                time.sleep(0.001)
+
+    except KeyboardInterrupt:
+        print("\nCtrl+C detected. Finalizing recording...")
+    except RuntimeError as exc:
+        print(f"Error recording frame: {exc}")
+    finally:
+        client.stop()
+
+        # 4. Drain the queue and finalize the recording
+        print(f"Finalizing recording with {recorder.queue_depth} frames still queued")
+        recorder.finalize()
+        print(
+            f"Recording finalized: {recorder.frames_written} frames written, "
+            f"{recorder.frames_dropped} dropped"
+        )
+
+
+if __name__ == "__main__":
+    main()
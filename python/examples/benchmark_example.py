@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Benchmark the Voyant frame-processing paths on this host.
+
+Each stage runs in a fresh process so its peak RSS is its own:
+  - decode:     VoyantPlayback iteration over the recording
+  - dataframe:  decode + pandas_utils.frame_to_dataframe
+  - pcd:        decode + pcd_utils.save_frame_to_pcd (into a temporary directory)
+  - record:     decode + VoyantRecorder.record_frame (into a temporary directory)
+  - receive:    CarbonClient.try_receive_frame for --duration seconds, from a
+                sensor (--config) or a local carbon_simulator (--sim)
+
+For every stage the report gives frames/s, points/s and peak RSS, plus
+per-frame latency percentiles for the recording stages and inter-frame gap
+percentiles (inter_frame_gap_ms) for receive. The report is JSON (stdout or --output) and includes
+the voyant_api and Python versions, so runs can be compared across SDK
+releases.
+
+Example usage:
+    python benchmark_example.py --input recording.vynt
+    python benchmark_example.py --input recording.vynt --stages decode pcd --max-frames 200
+    python benchmark_example.py --stages receive --sim --duration 30 --output bench.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+
+import numpy as np
+import voyant_api
+from voyant_api import (
+    CarbonClient,
+    CarbonConfig,
+    VoyantPlayback,
+    VoyantRecorder,
+    init_voyant_logging,
+)
+
+RECORDING_STAGES = ("decode", "dataframe", "pcd", "record")
+STAGES = RECORDING_STAGES + ("receive",)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Voyant frame-processing paths on this host",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        default=None,
+        help="Recording (.vynt or .bin) replayed by the decode, dataframe, pcd and record stages",
+    )
+    parser.add_argument(
+        "--stages",
+        nargs="+",
+        choices=STAGES,
+        default=None,
+        help="Stages to run. Defaults to the recording stages with --input, plus receive with --config or --sim.",
+    )
+    parser.add_argument(
+        "--max-frames",
+        type=int,
+        default=0,
+        help="Frames per recording stage; 0 for the whole recording",
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        metavar="PATH",
+        help="JSON device config for the receive stage",
+    )
+    parser.add_argument(
+        "--sim",
+        action="store_true",
+        help="Run the receive stage against a local carbon_simulator on loopback.",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=10.0,
+        metavar="SEC",
+        help="How long the receive stage runs",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Write the JSON report here instead of stdout",
+    )
+    args = parser.parse_args()
+    if args.stages is None:
+        args.stages = []
+        if args.input:
+            args.stages += RECORDING_STAGES
+        if args.config or args.sim:
+            args.stages.append("receive")
+        if not args.stages:
+            parser.error("pass --input and/or --config/--sim (or --stages)")
+    if any(s in RECORDING_STAGES for s in args.stages) and not args.input:
+        parser.error("the decode, dataframe, pcd and record stages need --input")
+    return args
+
+
+def _peak_rss_mb():
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def _summarize(durations, n_points, elapsed, metric="latency"):
+    """Throughput and percentiles of per-frame durations, reported as <metric>_ms."""
+    durations_ms = np.asarray(durations) * 1e3
+    n_frames = len(durations_ms)
+    summary = {
+        "frames": n_frames,
+        "points": n_points,
+        "elapsed_sec": elapsed,
+        "frames_per_sec": n_frames / elapsed if elapsed > 0 else 0.0,
+        "points_per_sec": n_points / elapsed if elapsed > 0 else 0.0,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+    if n_frames:
+        p50, p90, p99 = np.percentile(durations_ms, (50, 90, 99))
+        summary[f"{metric}_ms"] = {
+            "p50": p50,
+            "p90": p90,
+            "p99": p99,
+            "max": float(durations_ms.max()),
+        }
+    return summary
+
+
+def run_recording_stage(stage, input_path, max_frames):
+    """Replay a recording through one stage and time every frame."""
+    init_voyant_logging()
+    process = None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if stage == "dataframe":
+            from voyant_api.pandas_utils import frame_to_dataframe
+
+            process = frame_to_dataframe
+        elif stage == "pcd":
+            from voyant_api.pcd_utils import save_frame_to_pcd
+
+            def process(frame):
+                path = os.path.join(tmp_dir, f"frame_{frame.frame_index}.pcd")
+                save_frame_to_pcd(frame, path)
+
+        elif stage == "record":
+            recorder = VoyantRecorder(
+                output_path=os.path.join(tmp_dir, "benchmark.vynt"),
+                timestamp_filename=False,
+            )
+            process = recorder.record_frame
+
+        latencies = []
+        n_points = 0
+        with VoyantPlayback() as playback:
+            playback.open(input_path)
+            start = time.perf_counter()
+            while not max_frames or len(latencies) < max_frames:
+                t0 = time.perf_counter()
+                # The playback iterator raises StopIteration at end of file.
+                frame = next(playback, None)
+                if frame is None:
+                    break
+                if process is not None:
+                    process(frame)
+                latencies.append(time.perf_counter() - t0)
+                n_points += frame.n_valid_points
+            elapsed = time.perf_counter() - start
+
+        if stage == "record":
+            recorder.finalize()
+
+    return _summarize(latencies, n_points, elapsed)
+
+
+def run_receive_stage(config_path, sim, duration):
+    """Receive live frames for a fixed time and time the gaps between them."""
+    init_voyant_logging()
+    config = CarbonConfig.from_json(config_path) if config_path else CarbonConfig()
+    if sim:
+        config.set_interface_addr("127.0.0.1")
+        config.set_fpga_target_addr("127.0.0.1:1234")
+
+    client = CarbonClient(config)
+    client.start()
+    gaps = []
+    n_points = 0
+    empty_polls = 0
+    try:
+        start = time.perf_counter()
+        last = None
+        while client.is_running() and time.perf_counter() - start < duration:
+            frame = client.try_receive_frame()
+            now = time.perf_counter()
+            if frame is None:
+                empty_polls += 1
+                time.sleep(0.0001)
+                continue
+            if last is not None:
+                gaps.append(now - last)
+            last = now
+            n_points += frame.n_valid_points
+        elapsed = time.perf_counter() - start
+    finally:
+        client.stop()
+
+    summary = _summarize(gaps, n_points, elapsed, metric="inter_frame_gap")
+    # One more frame than inter-frame gaps was received.
+    summary["frames"] = len(gaps) + (1 if last is not None else 0)
+    summary["empty_polls"] = empty_polls
+    return summary
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    report = {
+        "voyant_api_version": getattr(voyant_api, "__version__", None),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "input": args.input,
+        "stages": {},
+    }
+
+    # "spawn" gives every stage a fresh interpreter, so peak RSS is per stage.
+    ctx = multiprocessing.get_context("spawn")
+    for stage in args.stages:
+        print(f"Running {stage}...", file=sys.stderr)
+        with ctx.Pool(1) as pool:
+            if stage == "receive":
+                result = pool.apply(
+                    run_receive_stage, (args.config, args.sim, args.duration)
+                )
+            else:
+                result = pool.apply(
+                    run_recording_stage, (stage, args.input, args.max_frames)
+                )
+        report["stages"][stage] = result
+        print(
+            f"  {result['frames_per_sec']:.1f} frames/s, "
+            f"{result['points_per_sec']:.0f} points/s, "
+            f"peak RSS {result['peak_rss_mb']:.0f} MB",
+            file=sys.stderr,
+        )
+
+    text = json.dumps(report, indent=2, default=float)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+        print(f"Report written to '{args.output}'", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
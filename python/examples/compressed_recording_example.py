@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Record live Voyant data with chunked compression, and play it back.
+
+The recorder's split limits (--frames-per-file, --size-per-file-mb, ...) bound
+each file, but 24/7 capture still fills disks. In `record` mode every split
+file is compressed as soon as the recorder moves on to the next one, on a
+background thread so the receive loop never waits for it. The compressed file
+(<recording>.cz) is a sequence of independent chunks, each tagged with its own
+codec, so a chunk that does not compress is stored raw, a corrupt chunk is
+reported on its own, and decompression streams with one chunk in memory.
+
+Playback is whole-file decompression. VoyantPlayback only opens plain files,
+so `play` mode, VoyantRecordingReader (recording_reader_example.py) and
+RecordingSet (recording_set_example.py) first decompress a .cz file in full to
+a temporary recording, removed when it is closed, and play that. Opening a .cz
+file costs a pass over the whole file and temporary disk space for it; chunking
+does not make seeking into it cheaper. Uncompressed recordings are played
+directly.
+
+Codecs: gzip, bz2 and lzma are always available; zstd and lz4 are used when the
+zstandard / lz4 packages are installed.
+
+Example usage:
+    python compressed_recording_example.py record --output recording.vynt --size-per-file-mb 500
+    python compressed_recording_example.py record --output recording.vynt --codec lzma --level 6
+    python compressed_recording_example.py play --input recording_20250101_000000.vynt.cz
+"""
+
+import argparse
+import bz2
+import contextlib
+import gzip
+import lzma
+import os
+import struct
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from voyant_api import CarbonClient, CarbonConfig
+from voyant_api import VoyantPlayback
+from voyant_api import VoyantRecorder
+from voyant_api import RecordStatus
+from voyant_api import init_voyant_logging
+
+COMPRESSED_SUFFIX = ".cz"
+MAGIC = b"VOYANTCZ1\n"
+# Per-chunk header: codec tag, uncompressed size, stored size.
+CHUNK_HEADER = struct.Struct("<4sQQ")
+DEFAULT_CHUNK_MB = 4
+
+
+def _zstd_codec():
+    import zstandard
+
+    return (
+        lambda data, level: zstandard.ZstdCompressor(level=level).compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+    )
+
+
+def _lz4_codec():
+    import lz4.frame
+
+    return (
+        lambda data, level: lz4.frame.compress(data, compression_level=level),
+        lz4.frame.decompress,
+    )
+
+
+# name -> (chunk tag, factory returning (compress(data, level), decompress(data)))
+CODECS = {
+    "zstd": (b"zstd", _zstd_codec),
+    "lz4": (b"lz4f", _lz4_codec),
+    "gzip": (b"gzip", lambda: (gzip.compress, gzip.decompress)),
+    "bz2": (b"bz2 ", lambda: (bz2.compress, bz2.decompress)),
+    "lzma": (
+        b"xz  ",
+        lambda: (
+            lambda data, level: lzma.compress(data, preset=level),
+            lzma.decompress,
+        ),
+    ),
+}
+RAW_TAG = b"raw "
+_CODEC_BY_TAG = {tag: factory for tag, factory in CODECS.values()}
+
+
+def available_codecs():
+    """Codec names whose packages are importable here."""
+    names = []
+    for name, (_, factory) in CODECS.items():
+        try:
+            factory()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Record Voyant data with chunked compression, or play it back",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+
+    record = subparsers.add_parser(
+        "record",
+        help="Record live data, compressing each split file",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    record.add_argument(
+        "--output",
+        type=str,
+        required=True,
+        help="Base path for the output recording file (.vynt or .bin)",
+    )
+    record.add_argument(
+        "--config",
+        type=str,
+        metavar="PATH",
+        help=(
+            "Path to a JSON device config (e.g. config/device_config.json "
+            "with your sensor interface_addr). "
+            "If omitted, default CarbonConfig values are used."
+        ),
+    )
+    record.add_argument(
+        "--codec",
+        choices=list(CODECS),
+        default="gzip",
+        help="Chunk compression codec (zstd and lz4 need their packages installed)",
+    )
+    record.add_argument(
+        "--level",
+        type=int,
+        default=3,
+        help="Compression level passed to the codec",
+    )
+    record.add_argument(
+        "--chunk-mb",
+        type=int,
+        default=DEFAULT_CHUNK_MB,
+        help="Uncompressed size of each independently compressed chunk",
+    )
+    record.add_argument(
+        "--keep-uncompressed",
+        action="store_true",
+        default=False,
+        help="Keep each split file after it has been compressed",
+    )
+    record.add_argument(
+        "--frames-per-file",
+        type=int,
+        default=None,
+        help="Maximum frames per file before splitting (None = no limit)",
+    )
+    record.add_argument(
+        "--duration-per-file",
+        type=int,
+        default=None,
+        help="Maximum seconds per file before splitting (None = no limit)",
+    )
+    record.add_argument(
+        "--size-per-file-mb",
+        type=int,
+        default=None,
+        help="Maximum MB per file before splitting (None = no limit)",
+    )
+    record.add_argument(
+        "--max-total-frames",
+        type=int,
+        default=None,
+        help="Maximum total frames across all files (None = no limit)",
+    )
+
+    play = subparsers.add_parser(
+        "play",
+        help="Play back a compressed (.cz) or plain recording",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    play.add_argument(
+        "--input",
+        type=str,
+        required=True,
+        help="Path to the recording (.cz, .vynt or .bin)",
+    )
+    play.add_argument(
+        "--keep-invalid-points",
+        action="store_true",
+        default=False,
+        help="Keep invalid points (disable filtering)",
+    )
+
+    return parser.parse_args()
+
+
+def compress_recording(path, codec="gzip", level=3, chunk_mb=DEFAULT_CHUNK_MB):
+    """Compress a finished recording to <path>.cz in independent chunks.
+
+    Returns:
+        Path of the compressed file
+    """
+    tag, factory = CODECS[codec]
+    compress, _ = factory()
+    chunk_size = chunk_mb * 1024 * 1024
+    out_path = path + COMPRESSED_SUFFIX
+    tmp_path = out_path + ".part"
+
+    with open(path, "rb") as src, open(tmp_path, "wb") as dst:
+        dst.write(MAGIC)
+        while chunk := src.read(chunk_size):
+            payload = compress(chunk, level)
+            chunk_tag = tag
+            if len(payload) >= len(chunk):
+                # Incompressible chunk: storing it raw is smaller and faster to read.
+                payload, chunk_tag = chunk, RAW_TAG
+            dst.write(CHUNK_HEADER.pack(chunk_tag, len(chunk), len(payload)))
+            dst.write(payload)
+
+    # Only a complete file gets the final name.
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+def _recording_files(output_path):
+    """Recordings in the output directory named like the recorder's output.
+
+    The recorder adds a timestamp and/or a split sequence number to the stem of
+    output_path, but it does not report the names it chose.
+    """
+    directory, name = os.path.split(os.path.abspath(output_path))
+    stem, ext = os.path.splitext(name)
+    if not os.path.isdir(directory):
+        # The recorder creates it.
+        return set()
+    return {
+        os.path.join(directory, entry)
+        for entry in os.listdir(directory)
+        if entry.startswith(stem) and entry.endswith(ext)
+    }
+
+
+def iter_chunks(path):
+    """Yield the decompressed chunks of a .cz file in order."""
+    with open(path, "rb") as src:
+        if src.read(len(MAGIC)) != MAGIC:
+            raise IOError(f"'{path}' is not a chunked compressed recording")
+        while header := src.read(CHUNK_HEADER.size):
+            tag, raw_size, stored_size = CHUNK_HEADER.unpack(header)
+            payload = src.read(stored_size)
+            if tag == RAW_TAG:
+                chunk = payload
+            else:
+                _, decompress = _CODEC_BY_TAG[tag]()
+                chunk = decompress(payload)
+            if len(chunk) != raw_size:
+                raise IOError(f"'{path}': corrupt chunk ({len(chunk)} != {raw_size})")
+            yield chunk
+
+
+def decompress_recording(path, directory):
+    """Decompress a whole .cz file into a directory.
+
+    Returns:
+        Path of the plain recording
+    """
+    plain_path = os.path.join(
+        directory, os.path.basename(path)[: -len(COMPRESSED_SUFFIX)]
+    )
+    with open(plain_path, "wb") as dst:
+        for chunk in iter_chunks(path):
+            dst.write(chunk)
+    return plain_path
+
+
+@contextlib.contextmanager
+def open_recording(path, **playback_kwargs):
+    """Open a plain or .cz recording as a VoyantPlayback.
+
+    A .cz file is decompressed in full to a temporary recording that is removed
+    on exit.
+    """
+    with contextlib.ExitStack() as stack:
+        if path.endswith(COMPRESSED_SUFFIX):
+            tmp_dir = stack.enter_context(
+                tempfile.TemporaryDirectory(prefix="voyant-cz-")
+            )
+            path = decompress_recording(path, tmp_dir)
+
+        playback = stack.enter_context(VoyantPlayback(**playback_kwargs))
+        playback.open(path)
+        yield playback
+
+
+def record(args):
+    config = CarbonConfig.from_json(args.config) if args.config else CarbonConfig()
+    client = CarbonClient(config)
+    client.start()
+
+    # Whatever appears next to the output path from here on is the recorder's.
+    seen = _recording_files(args.output)
+
+    def new_files():
+        files = sorted(_recording_files(args.output) - seen)
+        seen.update(files)
+        return files
+
+    recorder = VoyantRecorder(
+        output_path=args.output,
+        frames_per_file=args.frames_per_file,
+        duration_per_file=args.duration_per_file,
+        size_per_file_mb=args.size_per_file_mb,
+        max_total_frames=args.max_total_frames,
+    )
+
+    # Compression runs on its own thread; the receive loop only submits files.
+    compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="voyant-compress")
+    pending = []
+
+    def submit(paths):
+        for path in paths:
+            pending.append(compressor.submit(compress_finished_file, path))
+
+    def compress_finished_file(path):
+        out_path = compress_recording(path, args.codec, args.level, args.chunk_mb)
+        saved = os.path.getsize(path) - os.path.getsize(out_path)
+        if not args.keep_uncompressed:
+            os.remove(path)
+        print(f"Compressed '{path}' -> '{out_path}' ({saved / 1e6:.1f} MB saved)")
+
+    print(
+        f"Recording to '{args.output}' with {args.codec} chunks. Press Ctrl+C to stop."
+    )
+
+    # Files the recorder has opened and not yet handed to the compressor.
+    open_files = new_files()
+    try:
+        while client.is_running():
+            frame = client.try_receive_frame()
+            if frame is None:
+                time.sleep(0.001)
+                continue
+
+            status = recorder.record_frame(frame)
+
+            if status == RecordStatus.SPLIT:
+                # The recorder has moved on to a new file (the newest by split
+                # number); the ones before it are complete.
+                open_files += new_files()
+                submit(open_files[:-1])
+                open_files = open_files[-1:]
+            elif status == RecordStatus.STOP:
+                print("\nRecording limit reached. Finalizing...")
+                break
+            elif status != RecordStatus.OK:
+                print("Error recording frame")
+                break
+
+    except KeyboardInterrupt:
+        print("\nCtrl+C detected. Finalizing recording...")
+    finally:
+        client.stop()
+        # finalize() resets the counter.
+        frames_recorded = recorder.frames_recorded
+        recorder.finalize()
+        submit(open_files + new_files())
+        print(f"Waiting for {sum(not f.done() for f in pending)} files to compress...")
+        compressor.shutdown(wait=True)
+        for future in pending:
+            future.result()
+        print(f"Recording finalized after {frames_recorded} total frames")
+
+
+def play(args):
+    frame_count = 0
+    with open_recording(
+        args.input, filter_points=not args.keep_invalid_points
+    ) as playback:
+        for frame in playback:
+            if frame is None:
+                break
+            frame_count += 1
+            print(frame)
+
+            ###############################################
+            # Insert your point cloud processing magic here
+            ###############################################
+
+    print(f"\nPlayed {frame_count} frames")
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    if args.mode == "record":
+        if args.codec not in available_codecs():
+            raise SystemExit(
+                f"Codec '{args.codec}' is not installed; available: {available_codecs()}"
+            )
+        record(args)
+    else:
+        play(args)
+
+
+if __name__ == "__main__":
+    main()
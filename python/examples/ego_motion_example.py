@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Estimate sensor ego-velocity from radial velocity and mask the moving points.
+
+For a static point in direction u (unit vector from the sensor), a sensor
+moving with velocity v measures radial velocity -u . v. Most points in a scene
+are static, so a robust fit of radial velocity against bearing over the whole
+frame recovers v; points that disagree with it by more than --threshold m/s are
+moving. No tracking or frame history is needed.
+
+estimate_ego_velocity() is fully vectorized: RANSAC scores all hypotheses
+against a fixed random subsample of the points in one matrix product, so the
+scoring cost does not grow with the frame size. Only the winner is evaluated
+on every point, then refined by least squares on its inliers. segment_frame()
+returns the ego-velocity and a boolean `dynamic` array aligned with
+frame.valid_xyzv().
+
+Example usage:
+    python ego_motion_example.py --input recording.vynt
+    python ego_motion_example.py --config config/device_config.json --threshold 0.3
+"""
+
+import argparse
+import time
+
+import numpy as np
+from voyant_api import CarbonClient, CarbonConfig, VoyantPlayback, init_voyant_logging
+
+DEFAULT_THRESHOLD = 0.2
+# Points each RANSAC hypothesis is scored on.
+DEFAULT_SCORE_POINTS = 1024
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Estimate sensor ego-velocity and mask moving points",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        default=None,
+        help="Recording to process (.vynt or .bin). If omitted, frames are received live.",
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        metavar="PATH",
+        help=(
+            "Path to a JSON device config for live mode. "
+            "If omitted, default CarbonConfig values are used."
+        ),
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        metavar="M/S",
+        help="Radial velocity residual above which a point counts as moving",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=64,
+        help="RANSAC hypotheses per frame",
+    )
+    return parser.parse_args()
+
+
+def _bearings(xyz):
+    ranges = np.linalg.norm(xyz, axis=1, keepdims=True)
+    return xyz / np.maximum(ranges, 1e-6)
+
+
+def estimate_ego_velocity(
+    xyzv,
+    threshold=DEFAULT_THRESHOLD,
+    iterations=64,
+    min_inliers=10,
+    score_points=DEFAULT_SCORE_POINTS,
+    rng=None,
+):
+    """Robustly fit the sensor velocity to the radial velocities of a frame.
+
+    Args:
+        xyzv: (N, 4) array of x, y, z, radial velocity
+        threshold: Inlier residual bound (m/s)
+        iterations: Number of RANSAC hypotheses
+        min_inliers: Fewer inliers than this means no reliable estimate
+        score_points: Size of the random subsample hypotheses are scored on
+        rng: numpy Generator used to draw the samples
+
+    Returns:
+        Tuple (velocity, inliers): sensor velocity (3,) in the sensor frame,
+        NaN if no estimate could be made, and the (N,) boolean inlier mask
+    """
+    xyzv = np.asarray(xyzv, dtype=np.float64)
+    n = len(xyzv)
+    failed = np.full(3, np.nan), np.zeros(n, dtype=bool)
+    if n < max(3, min_inliers):
+        return failed
+
+    rng = rng if rng is not None else np.random.default_rng()
+    bearings = _bearings(xyzv[:, :3])
+    radial = xyzv[:, 3]
+
+    # Every hypothesis solves radial = -bearings @ v exactly for three points.
+    samples = rng.integers(0, n, size=(iterations, 3))
+    a = bearings[samples]
+    b = -radial[samples]
+    well_posed = np.abs(np.linalg.det(a)) > 1e-3
+    if not well_posed.any():
+        return failed
+    hypotheses = np.linalg.solve(a[well_posed], b[well_posed][..., None])[..., 0]
+
+    # (M, K) residuals of a subsample under every hypothesis; M is bounded by
+    # score_points, so this stays small however many points the frame has.
+    subset = rng.choice(n, size=min(n, score_points), replace=False)
+    residuals = np.abs(radial[subset, None] + bearings[subset] @ hypotheses.T)
+    scores = np.count_nonzero(residuals < threshold, axis=0)
+    best = hypotheses[int(np.argmax(scores))]
+    inliers = np.abs(radial + bearings @ best) < threshold
+
+    # Refine on the inliers, then re-select them once with the refined fit.
+    for _ in range(2):
+        if np.count_nonzero(inliers) < min_inliers:
+            return failed
+        velocity, *_ = np.linalg.lstsq(bearings[inliers], -radial[inliers], rcond=None)
+        inliers = np.abs(radial + bearings @ velocity) < threshold
+    return velocity, inliers
+
+
+def dynamic_mask(xyzv, velocity, threshold=DEFAULT_THRESHOLD):
+    """Boolean (N,) mask of points the ego-motion does not explain."""
+    xyzv = np.asarray(xyzv, dtype=np.float64)
+    if np.isnan(velocity).any():
+        return np.zeros(len(xyzv), dtype=bool)
+    expected = -_bearings(xyzv[:, :3]) @ velocity
+    return np.abs(xyzv[:, 3] - expected) >= threshold
+
+
+def segment_frame(frame, threshold=DEFAULT_THRESHOLD, iterations=64, rng=None):
+    """Ego-velocity and per-point dynamic mask of a VoyantFrame.
+
+    The mask follows the point order of frame.valid_xyzv().
+    """
+    xyzv = frame.valid_xyzv()
+    velocity, _ = estimate_ego_velocity(
+        xyzv, threshold=threshold, iterations=iterations, rng=rng
+    )
+    return velocity, dynamic_mask(xyzv, velocity, threshold)
+
+
+def iter_frames(args):
+    if args.input:
+        with VoyantPlayback() as playback:
+            playback.open(args.input)
+            for frame in playback:
+                if frame is None:
+                    return
+                yield frame
+    else:
+        config = CarbonConfig.from_json(args.config) if args.config else CarbonConfig()
+        client = CarbonClient(config)
+        client.start()
+        try:
+            while client.is_running():
+                frame = client.try_receive_frame()
+                if frame is None:
+                    time.sleep(0.001)
+                    continue
+                yield frame
+        finally:
+            client.stop()
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+    rng = np.random.default_rng()
+
+    try:
+        for frame in iter_frames(args):
+            velocity, dynamic = segment_frame(
+                frame, threshold=args.threshold, iterations=args.iterations, rng=rng
+            )
+
+            speed = float(np.linalg.norm(velocity))
+            print(
+                f"Frame {frame.frame_index}: ego velocity {np.round(velocity, 2)} "
+                f"({speed:.2f} m/s), {int(dynamic.sum())}/{len(dynamic)} points moving"
+            )
+
+            ###############################################
+            # Insert your point cloud processing magic here
+            ###############################################
+
+    except KeyboardInterrupt:
+        print("\nStopped")
+
+
+if __name__ == "__main__":
+    main()
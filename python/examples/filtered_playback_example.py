@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Play back a Voyant recording keeping only selected fields and points.
+
+Converting every frame to a full 11-column DataFrame costs time and memory even
+when a job only needs x/y/z and SNR from points within 50 m. project_frame()
+applies the projection and the point predicates without building a DataFrame:
+  - when every requested field and predicate is covered by frame.xyzv(), only
+    that 4-column array is fetched; otherwise the 11-column
+    frame.points_extended() array is;
+  - one mask (validity from frame.valid_mask(), then range / ROI / SNR) is
+    computed on that array, and only the requested columns of the surviving
+    points are copied out.
+Both paths apply the same validity mask, so the point set never depends on
+which fields were requested.
+
+Example usage:
+    python filtered_playback_example.py --input recording.vynt --fields x y z --range-max 50
+    python filtered_playback_example.py --input recording.vynt --fields x y z snr_linear --min-snr 10
+    python filtered_playback_example.py --input recording.vynt --roi 0 40 -10 10 -2 5
+"""
+
+import argparse
+
+import numpy as np
+from voyant_api import VoyantFrame, VoyantPlayback, init_voyant_logging
+
+# Fields available from frame.xyzv() and frame.points_extended(), in column order.
+XYZV_FIELDS = tuple(VoyantFrame.xyzv_columns())
+ALL_FIELDS = tuple(VoyantFrame.points_extended_columns())
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Play back a Voyant recording keeping only selected fields and points",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        required=True,
+        help="Path to the Voyant recording file (.vynt or .bin)",
+    )
+    parser.add_argument(
+        "--fields",
+        nargs="+",
+        choices=ALL_FIELDS,
+        default=list(XYZV_FIELDS),
+        help="Per-point fields to keep",
+    )
+    parser.add_argument(
+        "--range-max",
+        type=float,
+        default=None,
+        metavar="M",
+        help="Drop points farther than this from the sensor",
+    )
+    parser.add_argument(
+        "--min-snr",
+        type=float,
+        default=None,
+        help="Drop points with a linear SNR below this",
+    )
+    parser.add_argument(
+        "--roi",
+        type=float,
+        nargs=6,
+        default=None,
+        metavar=("XMIN", "XMAX", "YMIN", "YMAX", "ZMIN", "ZMAX"),
+        help="Keep only points inside this axis-aligned box (meters)",
+    )
+    parser.add_argument(
+        "--keep-invalid-points",
+        action="store_true",
+        default=False,
+        help="Keep invalid points (disable filtering)",
+    )
+    return parser.parse_args()
+
+
+def project_frame(
+    frame,
+    fields=XYZV_FIELDS,
+    range_max=None,
+    min_snr=None,
+    roi=None,
+    valid_only=True,
+):
+    """Select fields and points of a frame, filtering before copying.
+
+    Args:
+        frame: VoyantFrame instance
+        fields: Per-point field names to return
+        range_max: Drop points farther than this (meters), or None
+        min_snr: Drop points with snr_linear below this, or None
+        roi: (xmin, xmax, ymin, ymax, zmin, zmax) box to keep, or None
+        valid_only: If True, drop invalid points
+
+    Returns:
+        Dict of field name -> 1-D NumPy array, one entry per requested field
+    """
+    needs_extended = min_snr is not None or any(f not in XYZV_FIELDS for f in fields)
+    if needs_extended:
+        points, names = frame.points_extended(), ALL_FIELDS
+    else:
+        points, names = frame.xyzv(), XYZV_FIELDS
+    columns = {name: points[:, i] for i, name in enumerate(names)}
+
+    x, y, z = columns["x"], columns["y"], columns["z"]
+    if valid_only:
+        mask = np.asarray(frame.valid_mask(), dtype=bool)
+    else:
+        mask = np.ones(len(x), dtype=bool)
+    if range_max is not None:
+        mask &= x * x + y * y + z * z <= range_max * range_max
+    if roi is not None:
+        xmin, xmax, ymin, ymax, zmin, zmax = roi
+        mask &= (x >= xmin) & (x <= xmax)
+        mask &= (y >= ymin) & (y <= ymax)
+        mask &= (z >= zmin) & (z <= zmax)
+    if min_snr is not None:
+        mask &= columns["snr_linear"] >= min_snr
+
+    if mask.all():
+        return {name: columns[name] for name in fields}
+    return {name: columns[name][mask] for name in fields}
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    valid_only = not args.keep_invalid_points
+    with VoyantPlayback(filter_points=valid_only) as playback:
+        playback.open(args.input)
+
+        for frame in playback:
+            if frame is None:
+                break
+
+            points = project_frame(
+                frame,
+                fields=args.fields,
+                range_max=args.range_max,
+                min_snr=args.min_snr,
+                roi=args.roi,
+                valid_only=valid_only,
+            )
+            n_kept = len(next(iter(points.values())))
+            n_points = frame.n_valid_points if valid_only else frame.n_points
+            print(
+                f"Frame {frame.frame_index}: kept {n_kept}/{n_points} points, "
+                f"fields {list(points)}"
+            )
+
+            ###############################################
+            # Insert your point cloud processing magic here
+            ###############################################
+
+
+if __name__ == "__main__":
+    main()
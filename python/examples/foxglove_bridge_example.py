@@ -0,0 +1,534 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Stream Voyant frames to Foxglove over WebSocket and/or into an MCAP file.
+
+`bridge` mode reads frames from a sensor (--config / --sim) or a recording
+(--input) and publishes foxglove.PointCloud messages on the topics of
+config/voyant_foxglove_cfg.json, each colored by one quantity through
+red/green/blue/alpha fields:
+  /rng_color_pointcloud   range
+  /dop_color_pointcloud   radial (Doppler) velocity
+  /ref_color_pointcloud   calibrated reflectance
+  /snr_color_pointcloud   SNR
+Open that layout in Foxglove and connect to ws://localhost:8765.
+
+Live ingest never waits for encoding or viewers: frames are handed to the
+encoder thread through a single latest-frame slot, so when encoding falls
+behind the older frame is dropped (and counted) instead of queueing. A
+recording is not a live source, so its frames are encoded on the reading
+thread and none is dropped; it is read unpaced and paced to --rate with
+time.sleep(), which leaves the GIL free while waiting. --decimate N only
+publishes every Nth frame. Each viewer gets its own send queue of --backlog
+messages in the Foxglove SDK server, which drops messages for a viewer that
+cannot keep up rather than blocking the others.
+
+`probe` mode is a browser-less test client: it connects to a bridge, subscribes
+to every advertised channel and reports message counts and rates.
+
+Requires foxglove-sdk (pip install foxglove-sdk); probe mode requires
+websockets (pip install websockets).
+
+Example usage:
+    python foxglove_bridge_example.py bridge --config config/device_config.json
+    python foxglove_bridge_example.py bridge --input recording.vynt --rate 1.0 --mcap out.mcap
+    python foxglove_bridge_example.py bridge --sim --decimate 2 --topics /rng_color_pointcloud
+    python foxglove_bridge_example.py probe --url ws://localhost:8765 --duration 10
+"""
+
+import argparse
+import asyncio
+import json
+import struct
+import threading
+import time
+
+import numpy as np
+from voyant_api import (
+    CarbonClient,
+    CarbonConfig,
+    VoyantFrame,
+    VoyantPlayback,
+    init_voyant_logging,
+)
+
+TOPICS = (
+    "/rng_color_pointcloud",
+    "/dop_color_pointcloud",
+    "/ref_color_pointcloud",
+    "/snr_color_pointcloud",
+)
+DEFAULT_PORT = 8765
+FRAME_ID = "voyant"
+
+# Anchor colors of the turbo colormap, interpolated linearly.
+TURBO_ANCHORS = np.array(
+    [
+        [48, 18, 59],
+        [70, 107, 227],
+        [40, 188, 235],
+        [50, 241, 151],
+        [164, 252, 60],
+        [237, 208, 58],
+        [251, 128, 34],
+        [208, 47, 5],
+        [122, 4, 3],
+    ],
+    dtype=np.float32,
+)
+
+# Per-point fields of frame.points_extended(), in column order.
+EXTENDED_FIELDS = tuple(VoyantFrame.points_extended_columns())
+
+POINT_DTYPE = np.dtype(
+    [
+        ("x", np.float32),
+        ("y", np.float32),
+        ("z", np.float32),
+        ("red", np.uint8),
+        ("green", np.uint8),
+        ("blue", np.uint8),
+        ("alpha", np.uint8),
+    ]
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Stream Voyant frames to Foxglove over WebSocket and/or MCAP",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+
+    bridge = subparsers.add_parser(
+        "bridge",
+        help="Publish frames from a sensor or recording",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    bridge.add_argument(
+        "--input",
+        type=str,
+        default=None,
+        help="Recording to publish (.vynt or .bin). If omitted, frames are received live.",
+    )
+    bridge.add_argument(
+        "--rate",
+        type=float,
+        default=1.0,
+        help="Playback rate for --input (1.0 = real-time)",
+    )
+    bridge.add_argument(
+        "--config",
+        type=str,
+        metavar="PATH",
+        help=(
+            "Path to a JSON device config for live mode. "
+            "If omitted, default CarbonConfig values are used."
+        ),
+    )
+    bridge.add_argument(
+        "--sim",
+        action="store_true",
+        help="Receive from a local carbon_simulator on loopback.",
+    )
+    bridge.add_argument(
+        "--topics",
+        nargs="+",
+        choices=TOPICS,
+        default=list(TOPICS),
+        help="Topics to publish",
+    )
+    bridge.add_argument(
+        "--decimate",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Publish every Nth frame",
+    )
+    bridge.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="WebSocket server address",
+    )
+    bridge.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help="WebSocket server port",
+    )
+    bridge.add_argument(
+        "--backlog",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Messages queued per viewer before the server drops messages for it "
+            "(default: the SDK's)"
+        ),
+    )
+    bridge.add_argument(
+        "--no-server",
+        action="store_true",
+        help="Do not start the WebSocket server (MCAP only)",
+    )
+    bridge.add_argument(
+        "--mcap",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Also write every published message to this MCAP file",
+    )
+
+    probe = subparsers.add_parser(
+        "probe",
+        help="Connect to a bridge and report what it publishes",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    probe.add_argument(
+        "--url",
+        type=str,
+        default=f"ws://localhost:{DEFAULT_PORT}",
+        help="Bridge WebSocket URL",
+    )
+    probe.add_argument(
+        "--duration",
+        type=float,
+        default=10.0,
+        metavar="SEC",
+        help="How long to listen",
+    )
+
+    args = parser.parse_args()
+    if args.mode == "bridge" and args.no_server and not args.mcap:
+        parser.error("--no-server needs --mcap")
+    if args.mode == "bridge" and args.rate <= 0:
+        parser.error("--rate must be greater than 0")
+    return args
+
+
+def colorize(values, vmin, vmax):
+    """(N,) values -> (N, 3) uint8 turbo colors over [vmin, vmax]."""
+    scale = (len(TURBO_ANCHORS) - 1) / max(vmax - vmin, 1e-6)
+    position = np.clip((values - vmin) * scale, 0, len(TURBO_ANCHORS) - 1)
+    anchors = np.arange(len(TURBO_ANCHORS))
+    return np.stack(
+        [np.interp(position, anchors, TURBO_ANCHORS[:, c]) for c in range(3)], axis=1
+    ).astype(np.uint8)
+
+
+def frame_columns(frame):
+    """A frame's valid points as a dict of field name -> 1-D array.
+
+    The fields are those of frame.points_extended(), which include
+    calibrated_reflectance; the arrays are views of a single copy.
+    """
+    points = frame.valid_points_extended()
+    return {name: points[:, i] for i, name in enumerate(EXTENDED_FIELDS)}
+
+
+def color_values(columns, topic):
+    """The per-point quantity a topic is colored by, and its display range."""
+    if topic == "/rng_color_pointcloud":
+        x, y, z = columns["x"], columns["y"], columns["z"]
+        values = np.sqrt(x * x + y * y + z * z)
+    elif topic == "/dop_color_pointcloud":
+        values = columns["radial_vel"]
+        # Symmetric around zero so static points share one color.
+        bound = float(np.percentile(np.abs(values), 98)) if len(values) else 1.0
+        return values, -bound, bound
+    elif topic == "/ref_color_pointcloud":
+        values = columns["calibrated_reflectance"]
+    else:
+        values = 10.0 * np.log10(np.maximum(columns["snr_linear"], 1e-6))
+    if not len(values):
+        return values, 0.0, 1.0
+    vmin, vmax = np.percentile(values, (2, 98))
+    return values, float(vmin), float(vmax)
+
+
+def pointcloud_message(columns, topic, timestamp):
+    """Build a foxglove PointCloud of a frame colored for one topic."""
+    try:
+        from foxglove import messages
+    except ImportError:
+        # foxglove-sdk releases before foxglove.messages
+        from foxglove import schemas as messages
+
+    points = np.empty(len(columns["x"]), dtype=POINT_DTYPE)
+    for axis in "xyz":
+        points[axis] = columns[axis]
+    values, vmin, vmax = color_values(columns, topic)
+    rgb = colorize(values, vmin, vmax)
+    points["red"] = rgb[:, 0]
+    points["green"] = rgb[:, 1]
+    points["blue"] = rgb[:, 2]
+    points["alpha"] = 255
+
+    fields = [
+        messages.PackedElementField(
+            name=name,
+            offset=POINT_DTYPE.fields[name][1],
+            type=messages.PackedElementFieldNumericType.Float32
+            if POINT_DTYPE[name] == np.float32
+            else messages.PackedElementFieldNumericType.Uint8,
+        )
+        for name in POINT_DTYPE.names
+    ]
+    sec = int(timestamp)
+    return messages.PointCloud(
+        timestamp=messages.Timestamp(sec=sec, nsec=int(round((timestamp - sec) * 1e9))),
+        frame_id=FRAME_ID,
+        pose=messages.Pose(
+            position=messages.Vector3(x=0.0, y=0.0, z=0.0),
+            orientation=messages.Quaternion(x=0.0, y=0.0, z=0.0, w=1.0),
+        ),
+        point_stride=POINT_DTYPE.itemsize,
+        fields=fields,
+        data=points.tobytes(),
+    )
+
+
+class LatestFrameSlot:
+    """Hands the newest frame to one consumer thread; never blocks the producer."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._frame = None
+        self._closed = False
+        self.frames_dropped = 0
+
+    def put(self, frame):
+        with self._cond:
+            if self._frame is not None:
+                self.frames_dropped += 1
+            self._frame = frame
+            self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+
+    def take(self):
+        """Wait for a frame; returns None once closed and empty."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._frame is not None or self._closed)
+            frame, self._frame = self._frame, None
+            return frame
+
+
+class FoxgloveBridge:
+    """Publishes frames as colored PointClouds on Foxglove channels."""
+
+    def __init__(self, topics=TOPICS, decimate=1):
+        from foxglove.channels import PointCloudChannel
+
+        self._channels = {topic: PointCloudChannel(topic) for topic in topics}
+        self._decimate = max(1, decimate)
+        self._slot = LatestFrameSlot()
+        self._thread = threading.Thread(
+            target=self._run, name="voyant-foxglove", daemon=True
+        )
+        self.frames_offered = 0
+        self.frames_published = 0
+
+    @property
+    def frames_dropped(self):
+        return self._slot.frames_dropped
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._slot.close()
+        self._thread.join()
+
+    def _take_turn(self):
+        """Count an incoming frame; True if decimation lets it through."""
+        self.frames_offered += 1
+        return (self.frames_offered - 1) % self._decimate == 0
+
+    def offer(self, frame):
+        """Live ingest: hand the frame to the encoder thread and return immediately."""
+        if self._take_turn():
+            self._slot.put(frame)
+
+    def publish(self, frame):
+        """Recording input: encode and publish on the calling thread.
+
+        Used without start()/stop(); no frame is dropped.
+        """
+        if self._take_turn():
+            self._publish(frame)
+
+    def _publish(self, frame):
+        columns = frame_columns(frame)
+        log_time = int(frame.timestamp * 1e9)
+        for topic, channel in self._channels.items():
+            channel.log(
+                pointcloud_message(columns, topic, frame.timestamp),
+                log_time=log_time,
+            )
+        self.frames_published += 1
+
+    def _run(self):
+        while (frame := self._slot.take()) is not None:
+            self._publish(frame)
+
+
+def iter_frames(args):
+    if args.input:
+        # A paced VoyantPlayback holds the GIL while it waits, so read unpaced
+        # and sleep here instead, against the recording's own timestamps.
+        with VoyantPlayback() as playback:
+            playback.open(args.input)
+            start = None
+            for frame in playback:
+                if frame is None:
+                    return
+                if start is None:
+                    start = (time.monotonic(), frame.timestamp)
+                else:
+                    wall_start, first_timestamp = start
+                    due = wall_start + (frame.timestamp - first_timestamp) / args.rate
+                    delay = due - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                yield frame
+    else:
+        config = CarbonConfig.from_json(args.config) if args.config else CarbonConfig()
+        if args.sim:
+            config.set_interface_addr("127.0.0.1")
+            config.set_fpga_target_addr("127.0.0.1:1234")
+        client = CarbonClient(config)
+        client.start()
+        try:
+            while client.is_running():
+                frame = client.try_receive_frame()
+                if frame is None:
+                    time.sleep(0.001)
+                    continue
+                yield frame
+        finally:
+            client.stop()
+
+
+def run_bridge(args):
+    import foxglove
+
+    server = None
+    writer = None
+    if not args.no_server:
+        server = foxglove.start_server(
+            host=args.host, port=args.port, message_backlog_size=args.backlog
+        )
+        print(f"Foxglove WebSocket server on ws://{args.host}:{args.port}")
+    if args.mcap:
+        writer = foxglove.open_mcap(args.mcap, allow_overwrite=True)
+        print(f"Writing MCAP to '{args.mcap}'")
+
+    bridge = FoxgloveBridge(args.topics, decimate=args.decimate)
+    # Only live frames go through the encoder thread; see the module docstring.
+    live = not args.input
+    if live:
+        bridge.start()
+    print("Press Ctrl+C to stop\n")
+    try:
+        for frame in iter_frames(args):
+            if live:
+                bridge.offer(frame)
+            else:
+                bridge.publish(frame)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if live:
+            bridge.stop()
+        if writer is not None:
+            writer.close()
+        if server is not None:
+            server.stop()
+        print(
+            f"\nIngested {bridge.frames_offered} frames, published "
+            f"{bridge.frames_published}, dropped {bridge.frames_dropped} "
+            "while encoding was busy"
+        )
+
+
+async def probe(url, duration):
+    """Subscribe to every channel of a Foxglove WebSocket server and count messages."""
+    import websockets
+
+    counts = {}
+    bytes_received = {}
+    topic_by_subscription = {}
+    # Current SDK servers speak foxglove.sdk.v1, older bridges foxglove.websocket.v1.
+    start = time.monotonic()
+    async with websockets.connect(
+        url, subprotocols=["foxglove.sdk.v1", "foxglove.websocket.v1"], max_size=None
+    ) as ws:
+        deadline = start + duration
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                message = await asyncio.wait_for(ws.recv(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            except websockets.ConnectionClosed as exc:
+                print(f"Connection closed by the bridge ({exc})")
+                break
+            if isinstance(message, str):
+                op = json.loads(message)
+                if op.get("op") == "serverInfo":
+                    print(f"Server: {op.get('name')}")
+                elif op.get("op") == "advertise":
+                    subscriptions = []
+                    for channel in op["channels"]:
+                        subscription_id = len(topic_by_subscription) + 1
+                        topic_by_subscription[subscription_id] = channel["topic"]
+                        subscriptions.append(
+                            {"id": subscription_id, "channelId": channel["id"]}
+                        )
+                        print(
+                            f"Advertised {channel['topic']} "
+                            f"({channel.get('schemaName')}, {channel.get('encoding')})"
+                        )
+                    await ws.send(
+                        json.dumps({"op": "subscribe", "subscriptions": subscriptions})
+                    )
+            elif message and message[0] == 0x01:
+                # Message data: opcode, subscription id (u32), log time (u64), payload.
+                (subscription_id,) = struct.unpack_from("<I", message, 1)
+                topic = topic_by_subscription.get(subscription_id, subscription_id)
+                counts[topic] = counts.get(topic, 0) + 1
+                bytes_received[topic] = bytes_received.get(topic, 0) + len(message) - 13
+
+    # The bridge may close the connection before the duration is up.
+    elapsed = min(time.monotonic() - start, duration)
+    print()
+    for topic, count in sorted(counts.items()):
+        print(
+            f"{topic}: {count} messages ({count / max(elapsed, 1e-6):.1f}/s), "
+            f"{bytes_received[topic] / count / 1e3:.0f} kB average"
+        )
+    if not counts:
+        print("No messages received")
+    return counts
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    if args.mode == "bridge":
+        run_bridge(args)
+    else:
+        asyncio.run(probe(args.url, args.duration))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Transcode Voyant recordings to MCAP with ROS 2 sensor_msgs/PointCloud2 messages.
+
+Every frame becomes one CDR-encoded sensor_msgs/msg/PointCloud2 on --topic,
+stamped (header, log and publish time) with the frame timestamp, so the file
+plays back in ROS 2 tooling (ros2 bag play, Foxglove, rosbags) on the original
+timeline. Output is chunked and compressed (zstd by default).
+
+Encoding runs on all cores: frames are read and serialized in worker
+processes by parallel_map_example.map_frames(), and only the finished message
+bytes come back to the single writer. Decoding is not parallel: every worker
+decodes the file from its start (see parallel_map_example.py), so the speed-up
+is bounded by one decode pass. With --recording-set, --input is the base path
+given to the recorder (or any split file of the session) and every split file
+of that session is transcoded in time order into one MCAP (see
+recording_set_example.py).
+
+Point fields: x, y, z, radial_vel, snr_linear, calibrated_reflectance
+(float32); --extended-format adds noise_mean_estimate, min_ramp_snr (float32),
+point_index and nanosecs_since_frame (uint32). With --keep-invalid-points
+a drop_reason field (uint8) is appended and is_dense is false. All are taken
+from frame.points_extended().
+
+Requires mcap (pip install mcap); zstd compression also requires zstandard and
+lz4 compression requires lz4.
+
+Example usage:
+    python mcap_transcode_example.py --input recording.vynt --output recording.mcap
+    python mcap_transcode_example.py --input recording.vynt --recording-set --output day.mcap --workers 8
+    python mcap_transcode_example.py --input recording.vynt --output recording.mcap --compression lz4 --extended-format
+"""
+
+import argparse
+import functools
+import os
+import struct
+import time
+
+import numpy as np
+from voyant_api import VoyantFrame, init_voyant_logging
+
+from parallel_map_example import DEFAULT_CHUNK_FRAMES, map_frames
+from recording_set_example import RecordingSet
+
+DEFAULT_TOPIC = "/voyant/points"
+DEFAULT_FRAME_ID = "voyant"
+
+# sensor_msgs/PointField datatypes
+POINT_FIELD_UINT8 = 2
+POINT_FIELD_UINT32 = 6
+POINT_FIELD_FLOAT32 = 7
+
+STANDARD_FIELDS = {
+    "x": (np.float32, POINT_FIELD_FLOAT32),
+    "y": (np.float32, POINT_FIELD_FLOAT32),
+    "z": (np.float32, POINT_FIELD_FLOAT32),
+    "radial_vel": (np.float32, POINT_FIELD_FLOAT32),
+    "snr_linear": (np.float32, POINT_FIELD_FLOAT32),
+    "calibrated_reflectance": (np.float32, POINT_FIELD_FLOAT32),
+}
+EXTENDED_FIELDS = {
+    **STANDARD_FIELDS,
+    "noise_mean_estimate": (np.float32, POINT_FIELD_FLOAT32),
+    "min_ramp_snr": (np.float32, POINT_FIELD_FLOAT32),
+    "point_index": (np.uint32, POINT_FIELD_UINT32),
+    "nanosecs_since_frame": (np.uint32, POINT_FIELD_UINT32),
+}
+# Appended when invalid points are kept, so consumers can tell them apart.
+DROP_REASON_FIELD = {"drop_reason": (np.uint8, POINT_FIELD_UINT8)}
+
+# Column of each field in frame.points_extended().
+_COLUMNS = {name: i for i, name in enumerate(VoyantFrame.points_extended_columns())}
+
+# ros2msg schema: the message definition followed by every nested type.
+POINTCLOUD2_MSGDEF = """\
+std_msgs/Header header
+uint32 height
+uint32 width
+sensor_msgs/PointField[] fields
+bool is_bigendian
+uint32 point_step
+uint32 row_step
+uint8[] data
+bool is_dense
+================================================================================
+MSG: std_msgs/Header
+builtin_interfaces/Time stamp
+string frame_id
+================================================================================
+MSG: builtin_interfaces/Time
+int32 sec
+uint32 nanosec
+================================================================================
+MSG: sensor_msgs/PointField
+uint8 INT8    = 1
+uint8 UINT8   = 2
+uint8 INT16   = 3
+uint8 UINT16  = 4
+uint8 INT32   = 5
+uint8 UINT32  = 6
+uint8 FLOAT32 = 7
+uint8 FLOAT64 = 8
+string name
+uint32 offset
+uint8 datatype
+uint32 count
+"""
+
+COMPRESSIONS = ("zstd", "lz4", "none")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Transcode Voyant recordings to MCAP with PointCloud2 messages",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        required=True,
+        help="Path to the Voyant recording file (.vynt or .bin)",
+    )
+    parser.add_argument(
+        "--recording-set",
+        action="store_true",
+        default=False,
+        help=(
+            "Treat --input as a recorder base path (or one split file) and "
+            "transcode all split files of the session"
+        ),
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        required=True,
+        help="Output MCAP path",
+    )
+    parser.add_argument(
+        "--topic",
+        type=str,
+        default=DEFAULT_TOPIC,
+        help="Topic of the PointCloud2 messages",
+    )
+    parser.add_argument(
+        "--frame-id",
+        type=str,
+        default=DEFAULT_FRAME_ID,
+        help="header.frame_id of the PointCloud2 messages",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of encoding processes",
+    )
+    parser.add_argument(
+        "--chunk-frames",
+        type=int,
+        default=DEFAULT_CHUNK_FRAMES,
+        help="Consecutive frames encoded per task",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=COMPRESSIONS,
+        default="zstd",
+        help="MCAP chunk compression",
+    )
+    parser.add_argument(
+        "--chunk-size-mb",
+        type=int,
+        default=4,
+        help="Uncompressed size of each MCAP chunk",
+    )
+    parser.add_argument(
+        "--extended-format",
+        action="store_true",
+        default=False,
+        help="Add noise_mean_estimate, min_ramp_snr, point_index and nanosecs_since_frame",
+    )
+    parser.add_argument(
+        "--keep-invalid-points",
+        action="store_true",
+        default=False,
+        help="Keep invalid points (disable filtering)",
+    )
+    return parser.parse_args()
+
+
+class _CdrWriter:
+    """Little-endian CDR serializer for the handful of types PointCloud2 needs."""
+
+    def __init__(self):
+        # Encapsulation header: CDR_LE. Alignment is relative to what follows.
+        self._parts = [b"\x00\x01\x00\x00"]
+        self._size = 0
+
+    def _align(self, n):
+        padding = -self._size % n
+        if padding:
+            self._write(b"\x00" * padding)
+
+    def _write(self, data):
+        self._parts.append(data)
+        self._size += len(data)
+
+    def uint8(self, value):
+        self._write(struct.pack("<B", value))
+
+    def uint32(self, value):
+        self._align(4)
+        self._write(struct.pack("<I", value))
+
+    def int32(self, value):
+        self._align(4)
+        self._write(struct.pack("<i", value))
+
+    def string(self, value):
+        data = value.encode() + b"\x00"
+        self.uint32(len(data))
+        self._write(data)
+
+    def byte_sequence(self, data):
+        self.uint32(len(data))
+        self._write(data)
+
+    def getvalue(self):
+        return b"".join(self._parts)
+
+
+def point_dtype(fields):
+    return np.dtype([(name, dtype) for name, (dtype, _) in fields.items()])
+
+
+def encode_pointcloud2(
+    frame, frame_id=DEFAULT_FRAME_ID, extended=False, valid_only=True
+):
+    """Serialize a frame as a CDR sensor_msgs/msg/PointCloud2.
+
+    Args:
+        frame: VoyantFrame instance
+        frame_id: header.frame_id of the message
+        extended: If True, write the extended point fields
+        valid_only: If True, only valid points are written; otherwise every
+            point is written along with its drop_reason
+
+    Returns:
+        Tuple (timestamp_ns, message bytes)
+    """
+    fields = EXTENDED_FIELDS if extended else STANDARD_FIELDS
+    if not valid_only:
+        fields = {**fields, **DROP_REASON_FIELD}
+    dtype = point_dtype(fields)
+    source = frame.valid_points_extended() if valid_only else frame.points_extended()
+    points = np.empty(len(source), dtype=dtype)
+    for name in fields:
+        # point_index, nanosecs_since_frame and drop_reason are whole numbers
+        # stored as float.
+        points[name] = source[:, _COLUMNS[name]]
+    data = points.tobytes()
+
+    timestamp_ns = int(round(frame.timestamp * 1e9))
+    cdr = _CdrWriter()
+    cdr.int32(timestamp_ns // 1_000_000_000)
+    cdr.uint32(timestamp_ns % 1_000_000_000)
+    cdr.string(frame_id)
+    cdr.uint32(1)  # height: unordered cloud
+    cdr.uint32(len(points))  # width
+    cdr.uint32(len(fields))
+    for name, (_, datatype) in fields.items():
+        cdr.string(name)
+        cdr.uint32(dtype.fields[name][1])
+        cdr.uint8(datatype)
+        cdr.uint32(1)
+    cdr.uint8(0)  # is_bigendian
+    cdr.uint32(dtype.itemsize)  # point_step
+    cdr.uint32(len(data))  # row_step
+    cdr.byte_sequence(data)
+    cdr.uint8(1 if valid_only else 0)  # is_dense: only if every point is valid
+    return timestamp_ns, cdr.getvalue()
+
+
+def transcode_to_mcap(
+    paths,
+    output_path,
+    topic=DEFAULT_TOPIC,
+    frame_id=DEFAULT_FRAME_ID,
+    workers=None,
+    chunk_frames=DEFAULT_CHUNK_FRAMES,
+    compression="zstd",
+    chunk_size=4 * 1024 * 1024,
+    extended=False,
+    valid_only=True,
+):
+    """Transcode recordings, in the given order, into one MCAP file.
+
+    Args:
+        paths: Recording files, oldest first
+        output_path: MCAP file to write
+        topic: Topic of the PointCloud2 messages
+        frame_id: header.frame_id of every message
+        workers: Number of encoding processes (default: one per CPU)
+        chunk_frames: Consecutive frames encoded per task
+        compression: "zstd", "lz4" or "none"
+        chunk_size: Uncompressed MCAP chunk size in bytes
+        extended: If True, write the extended point fields
+        valid_only: If True, only valid points are written
+
+    Returns:
+        Dict with message count, bytes written, elapsed seconds, recording
+        duration and the real-time factor (recording duration / elapsed)
+    """
+    from mcap.writer import CompressionType, Writer
+
+    encode = functools.partial(
+        encode_pointcloud2,
+        frame_id=frame_id,
+        extended=extended,
+        valid_only=valid_only,
+    )
+    start_time = time.monotonic()
+    first_ns = last_ns = None
+    n_messages = 0
+
+    with open(output_path, "wb") as stream:
+        writer = Writer(
+            stream,
+            chunk_size=chunk_size,
+            compression=CompressionType[compression.upper()],
+        )
+        writer.start(profile="ros2", library="voyant-mcap-transcode")
+        schema_id = writer.register_schema(
+            name="sensor_msgs/msg/PointCloud2",
+            encoding="ros2msg",
+            data=POINTCLOUD2_MSGDEF.encode(),
+        )
+        channel_id = writer.register_channel(
+            topic=topic, message_encoding="cdr", schema_id=schema_id
+        )
+
+        for path in paths:
+            for timestamp_ns, data in map_frames(
+                path,
+                encode,
+                workers=workers,
+                chunk_frames=chunk_frames,
+                ordered=True,
+                filter_points=valid_only,
+            ):
+                writer.add_message(
+                    channel_id=channel_id,
+                    log_time=timestamp_ns,
+                    publish_time=timestamp_ns,
+                    data=data,
+                    sequence=n_messages,
+                )
+                n_messages += 1
+                first_ns = timestamp_ns if first_ns is None else first_ns
+                last_ns = timestamp_ns
+            print(f"Transcoded '{path}' ({n_messages} messages so far)")
+        writer.finish()
+
+    elapsed = time.monotonic() - start_time
+    duration = (last_ns - first_ns) / 1e9 if n_messages > 1 else 0.0
+    return {
+        "messages": n_messages,
+        "bytes": os.path.getsize(output_path),
+        "elapsed_sec": elapsed,
+        "recording_sec": duration,
+        "realtime_factor": duration / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+    valid_only = not args.keep_invalid_points
+
+    if args.recording_set:
+        # Only the file order is needed; RecordingSet sorts by first timestamp.
+        try:
+            rs = RecordingSet(args.input, filter_points=valid_only, prefetch=False)
+        except ValueError as exc:
+            raise SystemExit(str(exc))
+        with rs:
+            paths = rs.paths
+        print(f"Found {len(paths)} split files for '{args.input}'")
+    else:
+        paths = [args.input]
+
+    result = transcode_to_mcap(
+        paths,
+        args.output,
+        topic=args.topic,
+        frame_id=args.frame_id,
+        workers=args.workers,
+        chunk_frames=args.chunk_frames,
+        compression=args.compression,
+        chunk_size=args.chunk_size_mb * 1024 * 1024,
+        extended=args.extended_format,
+        valid_only=valid_only,
+    )
+
+    print(
+        f"\nDone. Wrote {result['messages']} messages "
+        f"({result['bytes'] / 1e6:.1f} MB) to '{args.output}' "
+        f"in {result['elapsed_sec']:.1f} s: "
+        f"{result['realtime_factor']:.1f}x real time"
+    )
+
+
+if __name__ == "__main__":
+    main()
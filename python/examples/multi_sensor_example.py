@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Receive from several Carbon sensors at once as time-aligned frame sets.
+
+MultiCarbonClient starts one CarbonClient per device config, each drained by
+its own FrameReceiver thread (see async_client_example.py), so no sensor waits
+on another's polling loop. Each frame timestamp is moved onto the host clock
+with that sensor's host<->FPGA offset from time_sync_state(), then frames are
+matched: a frame set is emitted when the oldest waiting frames of all sensors
+lie within --tolerance of each other, and frames older than the newest of them
+by more than that are discarded. Each sensor buffers at most --queue-size
+frames waiting for a match; when one sensor stalls, the others drop their
+oldest frames instead of growing without bound. The discard count includes
+frames the keep-latest FrameReceivers drop on overflow.
+
+Optionally each sensor's points are transformed into a common vehicle frame
+with a 4x4 extrinsic matrix and merged into one (N, 5) array of x, y, z,
+radial velocity and sensor number. Only valid points are merged.
+
+Extrinsics file format (JSON, one row-major 4x4 matrix per config path):
+    {"config/front.json": [[1, 0, 0, 1.2], [0, 1, 0, 0], [0, 0, 1, 1.5], [0, 0, 0, 1]]}
+
+Example usage:
+    python multi_sensor_example.py --config config/front.json config/rear.json
+    python multi_sensor_example.py --config config/front.json config/rear.json --extrinsics extrinsics.json
+"""
+
+import argparse
+import collections
+import json
+import threading
+
+import numpy as np
+from voyant_api import CarbonClient, CarbonConfig, init_voyant_logging
+
+from async_client_example import FrameReceiver
+
+DEFAULT_TOLERANCE_SEC = 0.02
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Receive time-aligned frame sets from several Carbon sensors",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        nargs="+",
+        required=True,
+        metavar="PATH",
+        help="One JSON device config per sensor (e.g. config/device_config.json)",
+    )
+    parser.add_argument(
+        "--extrinsics",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="JSON file mapping each config path to a 4x4 sensor-to-vehicle transform",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE_SEC,
+        metavar="SEC",
+        help="Maximum timestamp difference between frames of one set",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=8,
+        help="Frames buffered per sensor while waiting for a match",
+    )
+    return parser.parse_args()
+
+
+class MultiCarbonClient:
+    """Receives from several CarbonClients and yields time-aligned frame sets."""
+
+    def __init__(
+        self,
+        configs,
+        extrinsics=None,
+        tolerance=DEFAULT_TOLERANCE_SEC,
+        queue_size=8,
+    ):
+        """
+        Args:
+            configs: One CarbonConfig per sensor
+            extrinsics: Optional list of 4x4 sensor-to-common transforms, one per
+                sensor (None entries mean identity)
+            tolerance: Maximum timestamp difference within one frame set (seconds)
+            queue_size: Frames buffered per sensor while waiting for a match
+        """
+        self.clients = [CarbonClient(config) for config in configs]
+        self.extrinsics = (
+            [None if m is None else np.asarray(m, dtype=np.float64) for m in extrinsics]
+            if extrinsics is not None
+            else [None] * len(self.clients)
+        )
+        self.tolerance = tolerance
+        # (host_time, frame) pairs waiting for a match, oldest first.
+        self._pending = [collections.deque(maxlen=queue_size) for _ in self.clients]
+        self._cond = threading.Condition()
+        self._receivers = [
+            FrameReceiver(client, capacity=queue_size, overflow="keep-latest")
+            for client in self.clients
+        ]
+        self._forwarders = []
+        self.sets_emitted = 0
+        # Frames dropped from self._pending; see frames_discarded.
+        self._frames_unmatched = 0
+        # Host-clock timestamps of the last emitted set, in config order.
+        self.last_set_times = []
+
+    def start(self):
+        for sensor, (client, receiver) in enumerate(zip(self.clients, self._receivers)):
+            client.start()
+            receiver.start()
+            thread = threading.Thread(
+                target=self._forward,
+                args=(sensor, receiver),
+                name=f"voyant-multi-{sensor}",
+                daemon=True,
+            )
+            thread.start()
+            self._forwarders.append(thread)
+
+    def stop(self):
+        for client in self.clients:
+            client.stop()
+        for receiver in self._receivers:
+            receiver.stop()
+        with self._cond:
+            self._cond.notify_all()
+        for thread in self._forwarders:
+            thread.join()
+
+    @property
+    def frames_discarded(self):
+        """Frames that never made it into a set.
+
+        Counts both the frames dropped here (no match, or a full per-sensor
+        buffer) and those the keep-latest FrameReceivers dropped on overflow.
+        """
+        with self._cond:
+            unmatched = self._frames_unmatched
+        return unmatched + sum(r.frames_dropped for r in self._receivers)
+
+    def is_running(self):
+        return all(client.is_running() for client in self.clients)
+
+    def sync_states(self):
+        """Host<->FPGA time-sync state of every sensor, in config order."""
+        return [client.time_sync_state() for client in self.clients]
+
+    def _forward(self, sensor, receiver):
+        client = self.clients[sensor]
+        while True:
+            frame = receiver.receive_frame(timeout=0.5)
+            if frame is None:
+                if not self.is_running():
+                    return
+                continue
+            # offset_ns is host - FPGA, so adding it moves the sensor-clock
+            # timestamp onto the host clock shared by all sensors.
+            sync = client.time_sync_state()
+            host_time = frame.timestamp + (sync.offset_ns * 1e-9 if sync.valid else 0.0)
+            with self._cond:
+                pending = self._pending[sensor]
+                if len(pending) == pending.maxlen:
+                    # The full deque drops its oldest frame on append.
+                    self._frames_unmatched += 1
+                pending.append((host_time, frame))
+                self._cond.notify_all()
+
+    def _try_match(self):
+        """Pop one aligned frame set if available. Called with self._cond held."""
+        while all(self._pending):
+            head_times = [q[0][0] for q in self._pending]
+            reference = max(head_times)
+            if reference - min(head_times) <= self.tolerance:
+                self.sets_emitted += 1
+                heads = [q.popleft() for q in self._pending]
+                self.last_set_times = [host_time for host_time, _ in heads]
+                return [frame for _, frame in heads]
+            # The newest head frame is the reference; anything older than it
+            # by more than the tolerance can never be matched. At least one
+            # head is dropped, then the reference is recomputed.
+            for q in self._pending:
+                while q and q[0][0] < reference - self.tolerance:
+                    q.popleft()
+                    self._frames_unmatched += 1
+        return None
+
+    def frame_sets(self, timeout=None):
+        """Yield lists of frames (one per sensor, config order) until stopped."""
+        while self.is_running():
+            with self._cond:
+                frame_set = self._try_match()
+                if frame_set is None:
+                    self._cond.wait(timeout)
+                    continue
+            yield frame_set
+
+    def merge(self, frame_set):
+        """Merge the valid points of a frame set into one (N, 5) array.
+
+        Columns are x, y, z, radial_vel and sensor number.
+        """
+        parts = []
+        for sensor, (frame, transform) in enumerate(zip(frame_set, self.extrinsics)):
+            xyzv = frame.valid_xyzv().astype(np.float64, copy=False)
+            points = np.empty((len(xyzv), 5), dtype=np.float64)
+            if transform is None:
+                points[:, :3] = xyzv[:, :3]
+            else:
+                points[:, :3] = xyzv[:, :3] @ transform[:3, :3].T + transform[:3, 3]
+            # Radial velocity is along each point's line of sight from its own
+            # sensor, so it is carried over unchanged.
+            points[:, 3] = xyzv[:, 3]
+            points[:, 4] = sensor
+            parts.append(points)
+        return np.concatenate(parts)
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    configs = [CarbonConfig.from_json(path) for path in args.config]
+    extrinsics = None
+    if args.extrinsics:
+        with open(args.extrinsics) as f:
+            by_path = json.load(f)
+        extrinsics = [by_path.get(path) for path in args.config]
+
+    client = MultiCarbonClient(
+        configs,
+        extrinsics=extrinsics,
+        tolerance=args.tolerance,
+        queue_size=args.queue_size,
+    )
+    client.start()
+    print(f"Receiving from {len(configs)} sensors. Press Ctrl+C to stop\n")
+
+    try:
+        for frame_set in client.frame_sets(timeout=0.5):
+            merged = client.merge(frame_set)
+            # Spread on the host clock, the one frames were matched on.
+            times = client.last_set_times
+            spread_ms = 1e3 * (max(times) - min(times))
+            print(
+                f"Set {client.sets_emitted}: frames "
+                f"{[f.frame_index for f in frame_set]}, "
+                f"{len(merged)} merged points, spread {spread_ms:.1f} ms"
+            )
+
+            unsynced = [
+                path
+                for path, state in zip(args.config, client.sync_states())
+                if not state.valid
+            ]
+            if unsynced:
+                print(f"Warning: no host<->FPGA time sync yet for {unsynced}")
+
+            ###############################################
+            # Insert your point cloud processing magic here
+            ###############################################
+
+    except KeyboardInterrupt:
+        print(
+            f"\nEmitted {client.sets_emitted} frame sets, "
+            f"discarded {client.frames_discarded} unmatched or overflowed frames"
+        )
+    finally:
+        client.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Apply a per-frame function to a Voyant recording on several cores.
+
+map_frames(path, fn) is the parallel form of
+
+    for frame in playback:
+        yield fn(frame)
+
+The recording is cut into chunks of --chunk-frames consecutive frames, which
+are handed to a process pool. Every worker process keeps its own
+VoyantRecordingReader (see recording_reader_example.py) open for the whole job
+and reads its chunks from it, so frames are decoded where they are used and
+never pickled; only the return values of fn cross process boundaries. Results
+are streamed back as chunks finish, in recording order unless --unordered is
+given, with at most two chunks per worker in flight.
+
+Decoding itself is not parallelized. A playback has no seek and always reads
+from the first frame, so a worker whose last chunk ends at position p has
+decoded all p frames before it, its own or not. N workers together decode the
+recording close to N times over, and no run finishes faster than a single
+sequential decode. Use map_frames when fn is clearly more expensive than
+decoding a frame.
+
+fn must be picklable, i.e. defined at module level.
+
+Example usage:
+    python parallel_map_example.py --input recording.vynt
+    python parallel_map_example.py --input recording.vynt --workers 8 --chunk-frames 32 --unordered
+"""
+
+import argparse
+import collections
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+import numpy as np
+from voyant_api import init_voyant_logging
+
+from recording_reader_example import VoyantRecordingReader, load_index
+
+DEFAULT_CHUNK_FRAMES = 64
+
+# Per-process reader, opened by _init_worker.
+_reader = None
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Apply a per-frame function to a Voyant recording on several cores",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        required=True,
+        help="Path to the Voyant recording file (.vynt or .bin)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of worker processes",
+    )
+    parser.add_argument(
+        "--chunk-frames",
+        type=int,
+        default=DEFAULT_CHUNK_FRAMES,
+        help="Consecutive frames handed to a worker at a time",
+    )
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        default=False,
+        help="Yield results as chunks finish instead of in recording order",
+    )
+    parser.add_argument(
+        "--keep-invalid-points",
+        action="store_true",
+        default=False,
+        help="Keep invalid points (disable filtering)",
+    )
+    return parser.parse_args()
+
+
+def _init_worker(path, filter_points):
+    """Worker initializer: open this process's reader.
+
+    init_voyant_logging() is deliberately skipped: the worker is forked from a
+    parent that already called it, so the logger carries over, and calling it
+    again in the same process raises.
+    """
+    global _reader
+    _reader = VoyantRecordingReader(path, filter_points=filter_points)
+
+
+def _map_chunk(fn, start, stop):
+    """Worker: apply fn to the frames at positions [start, stop)."""
+    _reader.position = start
+    return [fn(frame) for frame in islice(_reader, stop - start)]
+
+
+def map_frames(
+    path,
+    fn,
+    workers=None,
+    chunk_frames=DEFAULT_CHUNK_FRAMES,
+    ordered=True,
+    filter_points=True,
+):
+    """Yield fn(frame) for every frame of a recording, computed in parallel.
+
+    Args:
+        path: Path to the Voyant recording file
+        fn: Picklable function taking a frame; its return value must be picklable
+        workers: Number of worker processes (default: one per CPU)
+        chunk_frames: Consecutive frames per task
+        ordered: If True, results come in recording order; otherwise in
+            completion order, chunk by chunk
+        filter_points: Whether to filter out invalid points
+
+    Yields:
+        fn(frame) for each frame
+    """
+    workers = workers or os.cpu_count()
+    # Build the index once here so the workers only load it.
+    frame_indices, _ = load_index(path, filter_points=filter_points)
+    chunks = iter(
+        (start, min(start + chunk_frames, len(frame_indices)))
+        for start in range(0, len(frame_indices), chunk_frames)
+    )
+    max_in_flight = 2 * workers
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(path, filter_points),
+    ) as pool:
+        in_flight = collections.deque(
+            pool.submit(_map_chunk, fn, start, stop)
+            for start, stop in islice(chunks, max_in_flight)
+        )
+        while in_flight:
+            if ordered:
+                done = [in_flight.popleft()]
+            else:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                done = [f for f in in_flight if f in finished]
+                for future in done:
+                    in_flight.remove(future)
+
+            for start, stop in islice(chunks, len(done)):
+                in_flight.append(pool.submit(_map_chunk, fn, start, stop))
+            for future in done:
+                yield from future.result()
+
+
+def frame_summary(frame):
+    """Example per-frame function: frame index, point count and median range."""
+    xyzv = frame.xyzv()
+    ranges = np.linalg.norm(xyzv[:, :3], axis=1)
+    median_range = float(np.median(ranges)) if len(ranges) else float("nan")
+    return frame.frame_index, len(xyzv), median_range
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    count = 0
+    for frame_index, n_points, median_range in map_frames(
+        args.input,
+        frame_summary,
+        workers=args.workers,
+        chunk_frames=args.chunk_frames,
+        ordered=not args.unordered,
+        filter_points=not args.keep_invalid_points,
+    ):
+        count += 1
+        print(
+            f"Frame {frame_index}: {n_points} points, median range {median_range:.2f} m"
+        )
+
+        ###############################################
+        # Insert your result handling here
+        ###############################################
+
+    print(f"\nProcessed {count} frames")
+
+
+if __name__ == "__main__":
+    main()
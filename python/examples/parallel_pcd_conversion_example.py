@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Convert a Voyant binary recording to per-frame PCD files on several cores.
+
+Same output and options as pcd_conversion_example.py, but the selected frames
+are split into contiguous ranges, one per worker process. Each worker opens its
+own VoyantPlayback and converts its range, so frames never cross process
+boundaries. Frame positions come from the cached frame index of
+recording_reader_example.py (<recording>.index.json). The first run builds it
+with one serial scan.
+
+Only PCD encoding and writing run in parallel; decoding does not, for the
+reason given in parallel_map_example.py. Here the worker with the last range
+decodes the whole file, so the speed-up is close to linear only when PCD
+encoding dominates, e.g. ascii or binary_compressed output or
+--extended-format. A .cz input is decompressed by every worker on its own.
+
+Each frame is saved as <output_dir>/frame_<frame_index>.pcd
+
+Example usage:
+    python parallel_pcd_conversion_example.py --input recording.vynt --output-dir ./pcd_out
+    python parallel_pcd_conversion_example.py --input recording.vynt --output-dir ./pcd_out --workers 8 --max-frames 0
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from voyant_api import init_voyant_logging
+from voyant_api.pcd_utils import save_frame_to_pcd
+
+from compressed_recording_example import open_recording
+from pcd_conversion_example import PCD_ENCODINGS, save_frame_to_pcd_encoded
+from recording_reader_example import load_index
+
+DEFAULT_MAX_FRAMES = 100
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Convert a Voyant binary recording to per-frame PCD files in parallel",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+
+    parser.add_argument(
+        "--input",
+        type=str,
+        required=True,
+        help="Path to the Voyant recording file (.vynt, .bin or .cz)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        required=True,
+        help="Directory to write PCD files into (will be created if it does not exist)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of worker processes",
+    )
+
+    # Frame selection
+    parser.add_argument(
+        "--max-frames",
+        type=int,
+        default=DEFAULT_MAX_FRAMES,
+        help=(
+            "Maximum number of frames to convert. "
+            f"Defaults to {DEFAULT_MAX_FRAMES} to avoid accidentally filling disk. "
+            "Pass 0 (or any negative value) for no limit."
+        ),
+    )
+    parser.add_argument(
+        "--min-frame-index",
+        type=int,
+        default=None,
+        help="Only convert frames with a sensor frame index >= this value",
+    )
+    parser.add_argument(
+        "--max-frame-index",
+        type=int,
+        default=None,
+        help="Only convert frames with a sensor frame index <= this value",
+    )
+
+    # Point options
+    parser.add_argument(
+        "--keep-invalid-points",
+        action="store_true",
+        default=False,
+        help="Include invalid points in converted PCD files",
+    )
+    parser.add_argument(
+        "--extended-format",
+        action="store_true",
+        default=False,
+        help=(
+            "Write all extended fields (adds calibrated_reflectance, "
+            "noise_mean_estimate, min_ramp_snr, point_index) instead of the "
+            "standard 7-field format"
+        ),
+    )
+    parser.add_argument(
+        "--encoding",
+        choices=PCD_ENCODINGS,
+        default=None,
+        help=(
+            "PCD DATA encoding. binary_compressed is LZF-compressed. "
+            "If omitted, save_frame_to_pcd's default encoding is used."
+        ),
+    )
+
+    return parser.parse_args()
+
+
+def select_positions(frame_indices, min_frame_index, max_frame_index, max_frames):
+    """Positions of the frames to convert, applying the frame index filters."""
+    selected = []
+    for position, frame_index in enumerate(frame_indices):
+        if min_frame_index is not None and frame_index < min_frame_index:
+            continue
+        if max_frame_index is not None and frame_index > max_frame_index:
+            # Matches pcd_conversion_example.py: the range ends at the first
+            # frame past --max-frame-index.
+            break
+        if max_frames is not None and len(selected) >= max_frames:
+            break
+        selected.append(position)
+    return selected
+
+
+def _convert_range(input_path, output_dir, positions, valid_only, extended, encoding):
+    """Worker: convert the frames at the given (ascending) positions.
+
+    Like parallel_map_example._init_worker, this leaves logging to the parent.
+    """
+    wanted = set(positions)
+    last = positions[-1]
+    converted = 0
+    n_points = 0
+
+    with open_recording(input_path, filter_points=valid_only) as playback:
+        for position, frame in enumerate(playback):
+            if frame is None or position > last:
+                break
+            if position not in wanted:
+                continue
+
+            pcd_path = os.path.join(output_dir, f"frame_{frame.frame_index}.pcd")
+            if encoding is None:
+                save_frame_to_pcd(
+                    frame, pcd_path, valid_only=valid_only, extended=extended
+                )
+            else:
+                save_frame_to_pcd_encoded(
+                    frame, pcd_path, encoding, valid_only=valid_only, extended=extended
+                )
+            converted += 1
+            n_points += frame.n_valid_points if valid_only else frame.n_points
+
+    return converted, n_points
+
+
+def convert_recording(
+    input_path,
+    output_dir,
+    workers=None,
+    valid_only=True,
+    extended=False,
+    encoding=None,
+    min_frame_index=None,
+    max_frame_index=None,
+    max_frames=None,
+):
+    """Convert a recording to per-frame PCD files across a process pool.
+
+    Args:
+        input_path: Path to the Voyant recording file
+        output_dir: Directory to write PCD files into (created if missing)
+        workers: Number of worker processes (default: one per CPU)
+        valid_only: If True, only valid points are written
+        extended: If True, write all extended fields
+        encoding: PCD DATA encoding ("ascii", "binary" or "binary_compressed"),
+            or None for save_frame_to_pcd's default
+        min_frame_index: Only convert frames with a sensor frame index >= this
+        max_frame_index: Only convert frames with a sensor frame index <= this
+        max_frames: Maximum number of frames to convert, or None for no limit
+
+    Returns:
+        Dict with converted frame and point counts, elapsed seconds and throughput
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count()
+    start_time = time.monotonic()
+
+    frame_indices, _ = load_index(input_path, filter_points=valid_only)
+    positions = select_positions(
+        frame_indices, min_frame_index, max_frame_index, max_frames
+    )
+
+    # Contiguous ranges: a worker decodes everything before its range anyway,
+    # so interleaved positions would not save decoding either.
+    n_ranges = min(workers, len(positions))
+    step = -(-len(positions) // n_ranges) if positions else 1
+    ranges = [positions[i : i + step] for i in range(0, len(positions), step)]
+
+    converted = 0
+    n_points = 0
+    if not ranges:
+        print("No frames matched the frame selection.")
+    with ProcessPoolExecutor(max_workers=max(1, n_ranges)) as pool:
+        futures = [
+            pool.submit(
+                _convert_range,
+                input_path,
+                output_dir,
+                r,
+                valid_only,
+                extended,
+                encoding,
+            )
+            for r in ranges
+        ]
+        for future in as_completed(futures):
+            frames_done, points_done = future.result()
+            converted += frames_done
+            n_points += points_done
+            print(f"Converted {converted}/{len(positions)} frames...")
+
+    elapsed = time.monotonic() - start_time
+    return {
+        "frames": converted,
+        "points": n_points,
+        "workers": n_ranges,
+        "elapsed_sec": elapsed,
+        "frames_per_sec": converted / elapsed if elapsed > 0 else 0.0,
+        "points_per_sec": n_points / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    result = convert_recording(
+        args.input,
+        args.output_dir,
+        workers=args.workers,
+        valid_only=not args.keep_invalid_points,
+        extended=args.extended_format,
+        encoding=args.encoding,
+        min_frame_index=args.min_frame_index,
+        max_frame_index=args.max_frame_index,
+        max_frames=args.max_frames if args.max_frames > 0 else None,
+    )
+
+    print(
+        f"\nDone. Converted {result['frames']} frames to '{args.output_dir}' "
+        f"with {result['workers']} workers in {result['elapsed_sec']:.1f} s "
+        f"({result['frames_per_sec']:.1f} frames/s, "
+        f"{result['points_per_sec']:.0f} points/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Stream a Voyant recording into Arrow record batches and a Parquet dataset.
+
+Building one pandas DataFrame per frame and concatenating thousands of them is
+slow and holds the whole drive in memory. Here each frame's points() array
+(valid_points() unless --keep-invalid-points) is sliced into columns without
+building a DataFrame. Points from consecutive frames are buffered column by
+column, with frame_index and timestamp added as columns, and emitted as a
+pyarrow.RecordBatch once --rows-per-batch points are buffered. Batches are
+written to a directory of Parquet files (part-00000.parquet, ...) rolling over
+every --rows-per-file rows, so memory stays bounded by one batch regardless of
+the recording length.
+
+Requires pyarrow (pip install pyarrow).
+
+Example usage:
+    python parquet_export_example.py --input recording.vynt --output-dir ./parquet_out
+    python parquet_export_example.py --input recording.vynt --output-dir ./parquet_out --rows-per-batch 500000
+"""
+
+import argparse
+import os
+
+import numpy as np
+from voyant_api import VoyantFrame, VoyantPlayback, init_voyant_logging
+
+DEFAULT_ROWS_PER_BATCH = 1_000_000
+DEFAULT_ROWS_PER_FILE = 20_000_000
+
+# Per-point columns of frame.points(), in column order.
+POINT_COLUMNS = tuple(VoyantFrame.points_columns())
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Export a Voyant recording to a Parquet dataset",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        required=True,
+        help="Path to the Voyant recording file (.vynt or .bin)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        required=True,
+        help="Directory to write Parquet files into (will be created if it does not exist)",
+    )
+    parser.add_argument(
+        "--rows-per-batch",
+        type=int,
+        default=DEFAULT_ROWS_PER_BATCH,
+        help="Points buffered before a record batch is emitted",
+    )
+    parser.add_argument(
+        "--rows-per-file",
+        type=int,
+        default=DEFAULT_ROWS_PER_FILE,
+        help="Points written to one Parquet file before starting the next",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=("zstd", "snappy", "lz4", "gzip", "none"),
+        default="zstd",
+        help="Parquet column compression codec",
+    )
+    parser.add_argument(
+        "--keep-invalid-points",
+        action="store_true",
+        default=False,
+        help="Keep invalid points (disable filtering)",
+    )
+    return parser.parse_args()
+
+
+def iter_record_batches(
+    playback, rows_per_batch=DEFAULT_ROWS_PER_BATCH, valid_only=True
+):
+    """Yield pyarrow.RecordBatches of points from every frame of a playback.
+
+    Every batch holds the per-point columns of frame.points() plus frame_index
+    and timestamp, and at least rows_per_batch rows except the last. Frames are
+    never split across batches.
+
+    Args:
+        playback: Open VoyantPlayback
+        rows_per_batch: Points buffered before a batch is emitted
+        valid_only: If True, only valid points are exported
+    """
+    import pyarrow as pa
+
+    pending = []
+    n_pending = 0
+
+    def flush():
+        columns = {
+            name: np.concatenate([chunk[name] for chunk in pending])
+            for name in pending[0]
+        }
+        return pa.RecordBatch.from_pydict(columns)
+
+    for frame in playback:
+        if frame is None:
+            break
+
+        points = frame.valid_points() if valid_only else frame.points()
+        n_points = len(points)
+        chunk = {
+            "frame_index": np.full(n_points, frame.frame_index, dtype=np.uint64),
+            "timestamp": np.full(n_points, frame.timestamp, dtype=np.float64),
+        }
+        chunk.update({name: points[:, i] for i, name in enumerate(POINT_COLUMNS)})
+        pending.append(chunk)
+        n_pending += n_points
+
+        if n_pending >= rows_per_batch:
+            yield flush()
+            pending = []
+            n_pending = 0
+
+    if pending:
+        yield flush()
+
+
+def write_parquet_dataset(
+    batches, output_dir, rows_per_file=DEFAULT_ROWS_PER_FILE, compression="zstd"
+):
+    """Write record batches to numbered Parquet files in output_dir.
+
+    Returns:
+        Tuple (files written, rows written)
+    """
+    import pyarrow.parquet as pq
+
+    os.makedirs(output_dir, exist_ok=True)
+    writer = None
+    n_files = 0
+    rows_in_file = 0
+    total_rows = 0
+
+    try:
+        for batch in batches:
+            if writer is None or rows_in_file >= rows_per_file:
+                if writer is not None:
+                    writer.close()
+                path = os.path.join(output_dir, f"part-{n_files:05d}.parquet")
+                writer = pq.ParquetWriter(path, batch.schema, compression=compression)
+                n_files += 1
+                rows_in_file = 0
+
+            writer.write_batch(batch)
+            rows_in_file += batch.num_rows
+            total_rows += batch.num_rows
+            print(f"Wrote {total_rows} points to {n_files} files...")
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return n_files, total_rows
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    valid_only = not args.keep_invalid_points
+    with VoyantPlayback(filter_points=valid_only) as playback:
+        playback.open(args.input)
+        batches = iter_record_batches(
+            playback, rows_per_batch=args.rows_per_batch, valid_only=valid_only
+        )
+        n_files, total_rows = write_parquet_dataset(
+            batches,
+            args.output_dir,
+            rows_per_file=args.rows_per_file,
+            compression=None if args.compression == "none" else args.compression,
+        )
+
+    print(
+        f"\nDone. Wrote {total_rows} points to {n_files} files in '{args.output_dir}'"
+    )
+    print("Read it back with e.g. pyarrow.dataset.dataset(output_dir).to_table()")
+
+
+if __name__ == "__main__":
+    main()
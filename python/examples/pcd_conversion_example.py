@@ -15,7 +15,9 @@ range by sensor frame index.
 
 By default each .pcd file contains the standard 7 fields: x, y, z, radial_vel,
 snr_linear, nanosecs_since_frame, drop_reason. Pass --extended-format to include all
-11 fields.
+11 fields. Pass --encoding to choose the PCD DATA encoding (ascii, binary or
+LZF-compressed binary_compressed); it changes only how the points are
+encoded, not the fields or their types.
 
 Note: Frame indices reflect sensor uptime and do not start from zero
 per recording. Use --keep-invalid-points to include invalid points in
@@ -25,16 +27,27 @@ Example usage:
     python pcd_conversion_example.py --input recording.vynt --output-dir ./pcd_out
     python pcd_conversion_example.py --input recording.vynt --output-dir ./pcd_out --max-frames 500
     python pcd_conversion_example.py --input recording.vynt --output-dir ./pcd_out --min-frame-index 1000 --max-frame-index 1099
+    python pcd_conversion_example.py --input recording.vynt --output-dir ./pcd_out --extended-format --encoding binary_compressed
 """
 
 import argparse
 import os
+
+from pypcd4 import Encoding
 from voyant_api import VoyantPlayback
 from voyant_api import init_voyant_logging
-from voyant_api.pcd_utils import save_frame_to_pcd
+from voyant_api.pcd_utils import (
+    frame_to_extended_pcd,
+    frame_to_pcd,
+    save_frame_to_pcd,
+)
 
 DEFAULT_MAX_FRAMES = 100
 
+PCD_ENCODINGS = [
+    e.value for e in (Encoding.ASCII, Encoding.BINARY, Encoding.BINARY_COMPRESSED)
+]
+
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -96,10 +109,40 @@ def parse_args():
             "standard 7-field format"
         ),
     )
+    parser.add_argument(
+        "--encoding",
+        choices=PCD_ENCODINGS,
+        default=None,
+        help=(
+            "PCD DATA encoding. binary_compressed is LZF-compressed. "
+            "If omitted, save_frame_to_pcd's default encoding is used."
+        ),
+    )
 
     return parser.parse_args()
 
 
+def save_frame_to_pcd_encoded(frame, path, encoding, valid_only=True, extended=False):
+    """Save a frame to a .pcd file with the given DATA encoding.
+
+    The point cloud is built by the same pcd_utils functions as
+    save_frame_to_pcd, so the fields and their (float32) types match its
+    output; only the DATA encoding differs.
+
+    Args:
+        frame: VoyantFrame instance
+        path: Output file path (should end in .pcd)
+        encoding: One of "ascii", "binary" or "binary_compressed"
+        valid_only: If True, only valid points are written, as in save_frame_to_pcd
+        extended: If True, write all 11 fields instead of the standard 7
+    """
+    if extended:
+        pc = frame_to_extended_pcd(frame, valid_only=valid_only)
+    else:
+        pc = frame_to_pcd(frame, valid_only=valid_only)
+    pc.save(path, encoding=Encoding(encoding))
+
+
 def main():
     init_voyant_logging()
     args = parse_args()
@@ -145,12 +188,21 @@ def main():
             #   pc = pcd_utils.frame_to_extended_pcd(frame)  # all fields
             #   pc.save(pcd_path)                             # save manually
             ###############################################
-            save_frame_to_pcd(
-                frame,
-                pcd_path,
-                valid_only=not args.keep_invalid_points,
-                extended=args.extended_format,
-            )
+            if args.encoding is None:
+                save_frame_to_pcd(
+                    frame,
+                    pcd_path,
+                    valid_only=not args.keep_invalid_points,
+                    extended=args.extended_format,
+                )
+            else:
+                save_frame_to_pcd_encoded(
+                    frame,
+                    pcd_path,
+                    args.encoding,
+                    valid_only=not args.keep_invalid_points,
+                    extended=args.extended_format,
+                )
             converted += 1
 
             if converted % 10 == 0:
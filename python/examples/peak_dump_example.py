@@ -5,33 +5,58 @@
 # See the LICENSE file in the repository root for full license text.
 
 """
-Dump the raw peak stream to a CSV file while the point cloud keeps streaming.
+Dump the raw peak stream to a file while the point cloud keeps streaming.
 
 The dump runs on its own writer thread, so the point cloud is unaffected — this
 example keeps draining frames the whole time. The dump ends when --max-frames
 (or --max-peaks) is reached, or when stopped on Ctrl+C.
 
+With --format csv the writer produces the CSV file itself. With --format npy or
+parquet the peak stream goes through a lossless PeakSubscriber (see
+peak_subscriber_example.py) instead, and every batch is appended to the output
+file as it arrives, so no CSV is written to disk:
+  - npy:      one structured NumPy array, memory-mapped by load_peak_dump()
+  - parquet:  columnar and compressed; requires pyarrow (pip install pyarrow)
+Integer fields are stored as uint32 and the noise estimate and bin powers as
+float32. A dump that receives no peaks still produces a valid, empty file.
+load_peak_dump() reads any of the three formats back as NumPy arrays.
+
 Example usage:
     python peak_dump_example.py peaks.csv
     python peak_dump_example.py peaks.csv --max-frames 100 --add-timestamp
+    python peak_dump_example.py peaks.npy --format npy --max-frames 1000
 """
 
 import argparse
+import os
 import time
+from itertools import islice
 
+import numpy as np
 from voyant_api import CarbonClient, CarbonConfig, init_voyant_logging
 
+from peak_subscriber_example import PEAK_COLUMNS, PeakSubscriber, peak_column_dtype
+
+PEAK_DUMP_FORMATS = ("csv", "npy", "parquet")
+ROWS_PER_BLOCK = 1_000_000
+
 
 def parse_args():
     parser = argparse.ArgumentParser(
-        description="Dump the raw peak stream to CSV while streaming",
+        description="Dump the raw peak stream to a file while streaming",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
     parser.add_argument(
         "output",
         type=str,
         metavar="PATH",
-        help="Output CSV path for the peak dump.",
+        help="Output path for the peak dump.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=PEAK_DUMP_FORMATS,
+        default="csv",
+        help="Output format; npy and parquet are written from the streamed peaks.",
     )
     parser.add_argument(
         "--config",
@@ -61,11 +86,151 @@ def parse_args():
     return parser.parse_args()
 
 
+def _csv_blocks(csv_path, rows_per_block=ROWS_PER_BLOCK):
+    """Yield (column names, (rows, n_columns) float64 block) from a peak CSV."""
+    with open(csv_path) as f:
+        names = [name.strip() for name in f.readline().split(",")]
+        while lines := list(islice(f, rows_per_block)):
+            block = np.loadtxt(lines, delimiter=",", dtype=np.float64, ndmin=2)
+            yield names, block
+
+
+class PeakDumpWriter:
+    """Appends peak batches to a .npy or .parquet file as they arrive.
+
+    The file and its schema are created up front, so closing a writer that
+    received no batch leaves an empty but valid file.
+    """
+
+    def __init__(self, path, fmt, columns=PEAK_COLUMNS):
+        """
+        Args:
+            path: Output file
+            fmt: "npy" or "parquet"
+            columns: Column names, in order; the dtype of each comes from
+                peak_column_dtype()
+        """
+        fields = [(name, peak_column_dtype(name)) for name in columns]
+        self.rows = 0
+        self._fmt = fmt
+        if fmt == "npy":
+            self._dtype = np.dtype(fields)
+            self._file = open(path, "wb")
+            self._write_npy_header()
+            self._header_size = self._file.tell()
+        elif fmt == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            self._schema = pa.schema(
+                [(name, pa.from_numpy_dtype(dtype)) for name, dtype in fields]
+            )
+            self._writer = pq.ParquetWriter(path, self._schema, compression="zstd")
+        else:
+            raise ValueError(f"Unknown peak dump format '{fmt}'")
+
+    def _write_npy_header(self):
+        np.lib.format.write_array_header_1_0(
+            self._file,
+            {
+                "descr": np.lib.format.dtype_to_descr(self._dtype),
+                "fortran_order": False,
+                "shape": (self.rows,),
+            },
+        )
+
+    def write(self, batch):
+        """Append one batch (dict of column name -> array, as from PeakSubscriber)."""
+        if self._fmt == "npy":
+            records = np.empty(len(next(iter(batch.values()))), dtype=self._dtype)
+            for name in self._dtype.names:
+                records[name] = batch[name]
+            self._file.write(records.tobytes())
+            self.rows += len(records)
+        else:
+            import pyarrow as pa
+
+            table = pa.table(batch, schema=self._schema)
+            self._writer.write_table(table)
+            self.rows += table.num_rows
+
+    def close(self):
+        if self._fmt == "npy":
+            # numpy pads the header for a growing row count, so the final
+            # shape is written in place over the placeholder.
+            self._file.seek(0)
+            self._write_npy_header()
+            if self._file.tell() != self._header_size:
+                raise IOError(f"'{self._file.name}': npy header changed size")
+            self._file.close()
+        else:
+            self._writer.close()
+
+
+def load_peak_dump(path):
+    """Load a csv, npy or parquet peak dump as a dict of column name -> array.
+
+    npy dumps are memory-mapped, so only the columns used are read from disk.
+    """
+    if path.endswith(".npy"):
+        table = np.load(path, mmap_mode="r")
+        return {name: table[name] for name in table.dtype.names}
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        return {
+            name: column.to_numpy()
+            for name, column in zip(table.column_names, table.columns)
+        }
+    with open(path) as f:
+        names = [name.strip() for name in f.readline().split(",")]
+    blocks = [block for _, block in _csv_blocks(path)]
+    data = np.concatenate(blocks) if blocks else np.empty((0, len(names)))
+    return {
+        name: data[:, i].astype(peak_column_dtype(name)) for i, name in enumerate(names)
+    }
+
+
+def _timestamped(path):
+    root, ext = os.path.splitext(path)
+    return f"{root}_{time.strftime('%Y%m%d_%H%M%S')}{ext}"
+
+
+def _stream_to_file(client, subscriber, writer):
+    """Write batches and drain frames until the peak stream ends.
+
+    Returns:
+        Number of frames received meanwhile
+    """
+    frame_count = 0
+    while client.is_running() and not subscriber.is_finished():
+        # Keep draining frames so the point cloud keeps flowing during the dump.
+        frame = client.try_receive_frame()
+        if frame is not None:
+            frame_count += 1
+            print(f"Frame {frame_count}: {frame}")
+
+        batch = subscriber.receive_batch(timeout=0)
+        if batch is not None:
+            writer.write(batch)
+        elif frame is None:
+            time.sleep(0.001)
+    return frame_count
+
+
 def main():
     init_voyant_logging()
     args = parse_args()
 
+    if args.format == "parquet":
+        # Fail before dumping rather than when the first batch is written.
+        import pyarrow.parquet  # noqa: F401
+
     config = CarbonConfig.from_json(args.config) if args.config else CarbonConfig()
+    subscriber = None
+    writer = None
+    streaming = False
     client = CarbonClient(config)
     client.start()
     print("CarbonClient started.")
@@ -75,26 +240,41 @@ def main():
         # first heartbeat so the sensor is actually streaming before we begin.
         client.wait_for_heartbeat()
 
-        client.start_peak_dump(
-            args.output,
-            max_frames=args.max_frames,
-            max_peaks=args.max_peaks,
-            add_timestamp=args.add_timestamp,
-        )
-        # With --add-timestamp the writer inserts a timestamp into the filename,
-        # so the final path differs from args.output.
-        dest = f"{args.output} (timestamped)" if args.add_timestamp else args.output
-        print(f"Peak dump started → {dest} (Ctrl+C to stop early)")
+        if args.format == "csv":
+            client.start_peak_dump(
+                args.output,
+                max_frames=args.max_frames,
+                max_peaks=args.max_peaks,
+                add_timestamp=args.add_timestamp,
+            )
+            # With --add-timestamp the writer inserts a timestamp into the filename,
+            # so the final path differs from args.output.
+            dest = f"{args.output} (timestamped)" if args.add_timestamp else args.output
+            print(f"Peak dump started → {dest} (Ctrl+C to stop early)")
 
-        # Keep draining frames so the point cloud keeps flowing during the dump.
-        frame_count = 0
-        while client.is_running() and client.is_peak_dumping():
-            frame = client.try_receive_frame()
-            if frame is not None:
-                frame_count += 1
-                print(f"Frame {frame_count}: {frame}")
-            else:
-                time.sleep(0.001)
+            # Keep draining frames so the point cloud keeps flowing during the dump.
+            frame_count = 0
+            while client.is_running() and client.is_peak_dumping():
+                frame = client.try_receive_frame()
+                if frame is not None:
+                    frame_count += 1
+                    print(f"Frame {frame_count}: {frame}")
+                else:
+                    time.sleep(0.001)
+        else:
+            # The peaks are streamed, not written by the SDK, so name the file here.
+            dest = _timestamped(args.output) if args.add_timestamp else args.output
+            writer = PeakDumpWriter(dest, args.format)
+            subscriber = PeakSubscriber(
+                client,
+                max_frames=args.max_frames,
+                max_peaks=args.max_peaks,
+                lossless=True,
+            )
+            subscriber.start()
+            streaming = True
+            print(f"Peak dump started → {dest} (Ctrl+C to stop early)")
+            frame_count = _stream_to_file(client, subscriber, writer)
 
         print(f"Peak dump finished after {frame_count} frames.")
     except KeyboardInterrupt:
@@ -103,6 +283,10 @@ def main():
         # wait_for_heartbeat), so only stop a dump that is actually running.
         if client.is_peak_dumping():
             client.stop_peak_dump()
+        if streaming:
+            # The stream ends on a whole frame; write out what is still queued.
+            _stream_to_file(client, subscriber, writer)
+        else:
             # The file ends on a whole frame; poll until the writer is done.
             while client.is_peak_dumping():
                 time.sleep(0.01)
@@ -110,7 +294,15 @@ def main():
     except RuntimeError as exc:
         print(f"Peak dump failed: {exc}")
     finally:
+        if subscriber is not None:
+            subscriber.stop()
         client.stop()
+        if writer is not None:
+            writer.close()
+            print(
+                f"Wrote {writer.rows} peaks to {dest} "
+                f"({os.path.getsize(dest)} bytes). Load it with load_peak_dump()."
+            )
 
 
 if __name__ == "__main__":
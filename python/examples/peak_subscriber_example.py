@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Receive the raw peak stream in-process as NumPy batches, without touching disk.
+
+PeakSubscriber points start_peak_dump() at a named pipe (FIFO) instead of a
+file. Two threads sit between the pipe and the consumer:
+  - the drain thread only reads: it cuts whatever complete rows have arrived
+    into one raw chunk and queues the bytes, so the pipe is emptied as fast as
+    the dump writer fills it;
+  - the parse thread turns each raw chunk into one batch (a dict of column
+    name -> array, uint32 for the integer fields and float32 for the noise
+    estimate and bin powers, the same layout as load_peak_dump() in
+    peak_dump_example.py) and queues it for the consumer.
+Each queue holds at most --max-queue entries. When the parser or the consumer
+lags, the oldest entry is dropped and counted in batches_dropped /
+rows_dropped, so neither parsing nor the consumer ever holds up the pipe and
+the dump writer. A lossless subscriber (lossless=True, used by
+peak_dump_example.py to write files) waits for room instead, so a slow
+consumer backs up into the pipe and no row is dropped.
+
+Batches can be taken with receive_batch(), iterated with batches(), or awaited
+with `async for batch in subscriber.batches_async()`. The dump runs on its own
+writer thread like a file dump, so the point cloud keeps flowing; this example
+keeps draining frames the whole time.
+
+Requires a platform with os.mkfifo (Linux, macOS).
+
+Example usage:
+    python peak_subscriber_example.py
+    python peak_subscriber_example.py --max-frames 100 --max-queue 4
+"""
+
+import argparse
+import asyncio
+import collections
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import numpy as np
+from voyant_api import CarbonClient, CarbonConfig, init_voyant_logging
+
+READ_SIZE = 1 << 20
+
+# Header of the peak CSV written by start_peak_dump(), in column order.
+PEAK_COLUMNS = (
+    "peak_index",
+    "timestamp_secs",
+    "timestamp_nanosecs",
+    "frame_start_toggle",
+    "laser_waveform_segment",
+    "switch_setting",
+    "ramp_count",
+    "mirror_encoder_count_latched",
+    "channel",
+    "noise_mean_estimate",
+    "frequency_bin",
+    "left_bin_power",
+    "center_bin_power",
+    "right_bin_power",
+)
+# Every other field is an integer count, index or register value.
+PEAK_FLOAT_COLUMNS = frozenset(
+    ("noise_mean_estimate", "left_bin_power", "center_bin_power", "right_bin_power")
+)
+
+
+def peak_column_dtype(name):
+    """uint32 for the integer peak fields, float32 for the rest (and unknown ones)."""
+    if name in PEAK_COLUMNS and name not in PEAK_FLOAT_COLUMNS:
+        return np.dtype(np.uint32)
+    return np.dtype(np.float32)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Receive the raw peak stream in-process as NumPy batches",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        metavar="PATH",
+        help=(
+            "Path to a JSON device config (e.g. config/device_config.json "
+            "with your sensor interface_addr). "
+            "If omitted, default CarbonConfig values are used."
+        ),
+    )
+    parser.add_argument(
+        "--max-frames",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Stop the peak stream after N whole frames. Unbounded if omitted.",
+    )
+    parser.add_argument(
+        "--max-queue",
+        type=int,
+        default=8,
+        metavar="N",
+        help=(
+            "Raw chunks awaiting parsing, and parsed batches awaiting the "
+            "consumer, buffered before the oldest is dropped"
+        ),
+    )
+    return parser.parse_args()
+
+
+class PeakSubscriber:
+    """Streams a client's peak dump through a FIFO into queued NumPy batches."""
+
+    def __init__(
+        self,
+        client: CarbonClient,
+        max_queue=8,
+        max_frames=None,
+        max_peaks=None,
+        lossless=False,
+    ):
+        """
+        Args:
+            client: A started CarbonClient
+            max_queue: Entries buffered per queue
+            max_frames: Stop the peak stream after this many whole frames
+            max_peaks: Stop the peak stream after this many rows
+            lossless: Wait for room in a full queue instead of dropping the
+                oldest entry
+        """
+        if max_queue < 1:
+            raise ValueError(f"max_queue must be at least 1, got {max_queue}")
+        self._client = client
+        self._max_queue = max_queue
+        self._max_frames = max_frames
+        self._max_peaks = max_peaks
+        self._lossless = lossless
+        self._closing = False
+        self._dir = tempfile.mkdtemp(prefix="voyant-peaks-")
+        self._fifo_path = os.path.join(self._dir, "peaks.csv")
+        # Raw chunks of complete CSV rows, drain thread -> parse thread.
+        self._raw = collections.deque()
+        # Parsed batches, parse thread -> consumer.
+        self._queue = collections.deque()
+        self._cond = threading.Condition()
+        self._threads = [
+            threading.Thread(target=self._drain, name="voyant-peak-drain", daemon=True),
+            threading.Thread(target=self._parse, name="voyant-peak-parse", daemon=True),
+        ]
+        self.columns = None
+        self.batches_received = 0
+        self.rows_received = 0
+        self.batches_dropped = 0
+        self.rows_dropped = 0
+
+    def start(self):
+        os.mkfifo(self._fifo_path)
+        for thread in self._threads:
+            thread.start()
+        self._client.start_peak_dump(
+            self._fifo_path, max_frames=self._max_frames, max_peaks=self._max_peaks
+        )
+
+    def stop(self):
+        """Stop the dump, wait for both threads to see the end and remove the FIFO.
+
+        A lossless subscriber drops whatever no longer fits from here on, so
+        stop() cannot wait on a consumer that has stopped reading. Read the
+        remaining batches until is_finished() first to keep them.
+        """
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        if self._client.is_peak_dumping():
+            self._client.stop_peak_dump()
+            while self._client.is_peak_dumping():
+                time.sleep(0.01)
+        # If the writer never opened the FIFO, the drain thread is still blocked in
+        # open(); opening and closing the write end releases it with EOF.
+        try:
+            os.close(os.open(self._fifo_path, os.O_WRONLY | os.O_NONBLOCK))
+        except OSError:
+            pass
+        for thread in self._threads:
+            if thread.ident is not None:
+                thread.join()
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def _put(self, queue, item, n_rows):
+        """Queue an item, dropping the oldest one if the queue is full.
+
+        Called with self._cond held. n_rows counts the rows of a dropped item.
+        A lossless subscriber waits for room instead until stop() is called.
+        """
+        if self._lossless:
+            self._cond.wait_for(lambda: len(queue) < self._max_queue or self._closing)
+        if len(queue) >= self._max_queue:
+            _, dropped_rows = queue.popleft()
+            self.batches_dropped += 1
+            self.rows_dropped += dropped_rows
+        queue.append((item, n_rows))
+        self._cond.notify_all()
+
+    def _drain(self):
+        pending = b""
+        try:
+            fd = os.open(self._fifo_path, os.O_RDONLY)
+            try:
+                while True:
+                    data = os.read(fd, READ_SIZE)
+                    if not data:
+                        break
+                    pending += data
+                    end = pending.rfind(b"\n")
+                    if end < 0:
+                        continue
+                    complete, pending = pending[: end + 1], pending[end + 1 :]
+                    self._queue_raw(complete)
+            finally:
+                os.close(fd)
+            if pending.strip():
+                self._queue_raw(pending + b"\n")
+        finally:
+            # Marks the end of the stream; never dropped.
+            with self._cond:
+                self._raw.append((None, 0))
+                self._cond.notify_all()
+
+    def _queue_raw(self, chunk):
+        if self.columns is None:
+            # The header is taken here so that dropping a chunk never loses it.
+            header, _, chunk = chunk.partition(b"\n")
+            self.columns = [name.strip() for name in header.decode().split(",")]
+        n_rows = chunk.count(b"\n")
+        if not n_rows:
+            return
+        with self._cond:
+            self.batches_received += 1
+            self.rows_received += n_rows
+            self._put(self._raw, chunk, n_rows)
+
+    def _parse(self):
+        try:
+            while True:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._raw)
+                    chunk, n_rows = self._raw.popleft()
+                    self._cond.notify_all()
+                if chunk is None:
+                    return
+                lines = [line for line in chunk.decode().splitlines() if line]
+                rows = np.loadtxt(lines, delimiter=",", dtype=np.float64, ndmin=2)
+                batch = {
+                    name: rows[:, i].astype(peak_column_dtype(name))
+                    for i, name in enumerate(self.columns)
+                }
+                with self._cond:
+                    self._put(self._queue, batch, n_rows)
+        finally:
+            # Marks the end of the stream; never dropped.
+            with self._cond:
+                self._queue.append((None, 0))
+                self._cond.notify_all()
+
+    @property
+    def queue_depth(self):
+        with self._cond:
+            return sum(batch is not None for batch, _ in self._queue)
+
+    def receive_batch(self, timeout=None):
+        """Wait for the next batch.
+
+        Args:
+            timeout: Seconds to wait, 0 to poll, or None to wait indefinitely
+
+        Returns:
+            Dict of column name -> array, or None on timeout or at the end of
+            the stream (check is_finished() to tell them apart)
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._queue, timeout=timeout):
+                return None
+            if self._queue[0][0] is None:
+                # Leave the end marker for later calls.
+                return None
+            batch, _ = self._queue.popleft()
+            self._cond.notify_all()
+            return batch
+
+    def is_finished(self):
+        with self._cond:
+            return bool(self._queue) and self._queue[0][0] is None
+
+    def batches(self):
+        """Iterate over batches until the peak stream ends."""
+        while True:
+            batch = self.receive_batch(timeout=0.5)
+            if batch is not None:
+                yield batch
+            elif self.is_finished():
+                return
+
+    async def batches_async(self):
+        """Asynchronously iterate over batches until the peak stream ends."""
+        while True:
+            batch = await asyncio.to_thread(self.receive_batch, 0.5)
+            if batch is not None:
+                yield batch
+            elif self.is_finished():
+                return
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    config = CarbonConfig.from_json(args.config) if args.config else CarbonConfig()
+    client = CarbonClient(config)
+    client.start()
+    print("CarbonClient started.")
+
+    subscriber = PeakSubscriber(
+        client, max_queue=args.max_queue, max_frames=args.max_frames
+    )
+    try:
+        # A dump only receives data while the pipeline is running.
+        client.wait_for_heartbeat()
+        subscriber.start()
+        print("Peak stream started (Ctrl+C to stop)")
+
+        frame_count = 0
+        while client.is_running() and not subscriber.is_finished():
+            # Keep draining frames so the point cloud keeps flowing.
+            frame = client.try_receive_frame()
+            if frame is not None:
+                frame_count += 1
+
+            batch = subscriber.receive_batch(timeout=0)
+            if batch is not None:
+                n_rows = len(next(iter(batch.values())))
+                print(
+                    f"Peak batch: {n_rows} rows, columns {subscriber.columns}, "
+                    f"{frame_count} frames so far, "
+                    f"dropped {subscriber.batches_dropped} batches"
+                )
+
+                ###############################################
+                # Insert your waveform diagnostics here
+                ###############################################
+
+            elif frame is None:
+                time.sleep(0.001)
+
+    except KeyboardInterrupt:
+        print("\nStopping peak stream...")
+    except RuntimeError as exc:
+        print(f"Peak stream failed: {exc}")
+    finally:
+        subscriber.stop()
+        client.stop()
+        print(
+            f"Received {subscriber.rows_received} peak rows in "
+            f"{subscriber.batches_received} batches; dropped "
+            f"{subscriber.rows_dropped} rows in {subscriber.batches_dropped} batches"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,14 @@
 """
 Script to process Voyant recording files frame by frame.
 Prints frame information and point cloud data as pandas DataFrames.
+
+With --prefetch N, frames are decoded up to N ahead on a background thread, so
+decoding the next frame overlaps with processing the current one.
 """
 
 import argparse
+import queue
+import threading
 from voyant_api import VoyantPlayback
 from voyant_api import init_voyant_logging
 from voyant_api.pandas_utils import frame_to_dataframe
@@ -50,9 +55,61 @@ def parse_args():
         help="Keep invalid points (disable filtering)",
     )
 
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=0,
+        help="Decode up to this many frames ahead on a background thread (0 = off)",
+    )
+
     return parser.parse_args()
 
 
+def prefetch_frames(playback, depth):
+    """Iterate a playback with up to `depth` frames decoded ahead on a thread.
+
+    Yields frames like iterating the playback directly and stops at the end of
+    the recording. Errors raised while decoding are re-raised in the caller.
+    """
+    ready = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    end = object()
+
+    def put(item):
+        # Wake up now and then so an abandoned iterator ends the thread.
+        while not stop.is_set():
+            try:
+                ready.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def decode():
+        try:
+            for frame in playback:
+                if frame is None or not put(frame):
+                    break
+        except Exception as exc:
+            put(exc)
+            return
+        put(end)
+
+    thread = threading.Thread(target=decode, name="voyant-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = ready.get()
+            if item is end:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
 def main():
     init_voyant_logging()
     args = parse_args()
@@ -68,7 +125,8 @@ def main():
     playback.open(args.input)
 
     # Process frames
-    for frame in playback:
+    frames = prefetch_frames(playback, args.prefetch) if args.prefetch > 0 else playback
+    for frame in frames:
         if frame is None:
             break
 
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Reuse one set of preallocated per-field point arrays across frames.
+
+Calling frame.xyzv() and frame_to_dataframe() from several places per frame
+allocates fresh arrays each time, and at full frame rate that churn dominates
+memory profiles. PointBuffer keeps one contiguous array per requested point
+field, grows it only when a frame has more points than any before, and
+converts each frame exactly once, with no intermediate DataFrame. Consumers
+then get read-only NumPy views of each field; because every field is
+contiguous, pandas (copy=False) and Arrow can wrap the views without copying.
+
+This is not zero-copy. The bindings can only hand out a new (N, K) array per
+call, so fill() still makes two copies: the bindings allocate the narrowest
+array covering the requested fields (xyz, xyzv, points or points_extended),
+and its columns are then copied into the buffer. Requesting fewer fields
+shrinks the first copy; only the buffer's own arrays are reused.
+
+Example usage:
+    python point_buffer_example.py --input recording.vynt
+    python point_buffer_example.py --input recording.vynt --keep-invalid-points
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+from voyant_api import VoyantFrame, VoyantPlayback, init_voyant_logging
+
+# Per-point fields and the dtype each is stored with.
+POINT_FIELDS = {
+    "x": np.float32,
+    "y": np.float32,
+    "z": np.float32,
+    "radial_vel": np.float32,
+    "snr_linear": np.float32,
+    "calibrated_reflectance": np.float32,
+    "noise_mean_estimate": np.float32,
+    "min_ramp_snr": np.float32,
+    "point_index": np.uint32,
+    "drop_reason": np.uint8,
+    "nanosecs_since_frame": np.uint32,
+}
+
+# Frame accessors, narrowest first: (columns, all-points method, valid-points method).
+_SOURCES = (
+    (VoyantFrame.xyz_columns(), "xyz", "valid_xyz"),
+    (VoyantFrame.xyzv_columns(), "xyzv", "valid_xyzv"),
+    (VoyantFrame.points_columns(), "points", "valid_points"),
+    (VoyantFrame.points_extended_columns(), "points_extended", "valid_points_extended"),
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Reuse preallocated per-field point arrays across frames",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        required=True,
+        help="Path to the Voyant recording file (.vynt or .bin)",
+    )
+    parser.add_argument(
+        "--keep-invalid-points",
+        action="store_true",
+        default=False,
+        help="Keep invalid points (disable filtering)",
+    )
+    return parser.parse_args()
+
+
+class PointBuffer:
+    """Preallocated struct-of-arrays storage for one frame's points."""
+
+    def __init__(self, capacity=0, fields=tuple(POINT_FIELDS)):
+        """
+        Args:
+            capacity: Points to allocate room for up front
+            fields: Point fields to keep (keys of POINT_FIELDS)
+        """
+        unknown = set(fields) - set(POINT_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown point fields: {sorted(unknown)}")
+        self._dtypes = {name: POINT_FIELDS[name] for name in fields}
+        columns, self._all, self._valid = next(
+            source for source in _SOURCES if set(fields) <= set(source[0])
+        )
+        self._columns = {name: columns.index(name) for name in fields}
+        self._n_points = 0
+        self._arrays = {
+            name: np.empty(capacity, dtype=dtype)
+            for name, dtype in self._dtypes.items()
+        }
+
+    @property
+    def capacity(self):
+        return len(next(iter(self._arrays.values())))
+
+    def __len__(self):
+        return self._n_points
+
+    def _reserve(self, n_points):
+        if n_points <= self.capacity:
+            return
+        # Grow geometrically so a slowly rising point count settles quickly.
+        capacity = max(n_points, 2 * self.capacity)
+        self._arrays = {
+            name: np.empty(capacity, dtype=dtype)
+            for name, dtype in self._dtypes.items()
+        }
+
+    def fill(self, frame, valid_only=True):
+        """Copy a frame's points into the buffer, replacing the previous frame.
+
+        Views returned before this call are invalidated: they now show the new
+        frame's data (or stale memory if the buffer had to grow).
+
+        Args:
+            frame: VoyantFrame to copy
+            valid_only: If True, only valid points are copied
+        """
+        points = getattr(frame, self._valid if valid_only else self._all)()
+        n_points = len(points)
+        self._reserve(n_points)
+        for name, array in self._arrays.items():
+            np.copyto(
+                array[:n_points], points[:, self._columns[name]], casting="unsafe"
+            )
+        self._n_points = n_points
+        return self
+
+    def field(self, name):
+        """Read-only view of one field for the current frame."""
+        view = self._arrays[name][: self._n_points]
+        view.flags.writeable = False
+        return view
+
+    def fields(self):
+        """Read-only views of every field, keyed by name."""
+        return {name: self.field(name) for name in self._arrays}
+
+    def to_dataframe(self):
+        """A DataFrame backed by the buffer's arrays rather than a copy of them."""
+        return pd.DataFrame(self.fields(), copy=False)
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    valid_only = not args.keep_invalid_points
+    playback = VoyantPlayback(filter_points=valid_only)
+    playback.open(args.input)
+
+    # Only x, y, z are used below, so only the (N, 3) xyz array is fetched.
+    buffer = PointBuffer(fields=("x", "y", "z"))
+
+    for frame in playback:
+        if frame is None:
+            break
+
+        buffer.fill(frame, valid_only=valid_only)
+        x, y, z = buffer.field("x"), buffer.field("y"), buffer.field("z")
+        ranges = np.sqrt(x * x + y * y + z * z)
+
+        print(
+            f"Frame {frame.frame_index}: {len(buffer)} points, "
+            f"max range {ranges.max(initial=0.0):.2f} m, "
+            f"buffer capacity {buffer.capacity}"
+        )
+
+        ###############################################
+        # Insert your point cloud processing magic here, e.g.:
+        #   df = buffer.to_dataframe()
+        #   table = pyarrow.table(buffer.fields())
+        ###############################################
+
+
+if __name__ == "__main__":
+    main()
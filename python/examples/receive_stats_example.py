@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Instrument the live receive path: latency, drops and backlog.
+
+sensor_state() and time_sync_state() describe the sensor; ReceiveStats
+describes what the consumer sees. It wraps try_receive_frame() and tracks:
+  - polls and empty polls
+  - frames received, and frames missed by reason, inferred from gaps and
+    reordering in the sensor frame_index sequence
+  - backlog high-water mark: the most frames drained back to back without the
+    client running dry, i.e. how far the consumer fell behind
+  - histograms of delivery latency and of the gap between consecutive frames
+
+frame.timestamp is on the sensor's FPGA clock. Latency is host receive time
+minus that timestamp moved onto the host clock with time_sync_state().offset_ns
+(host - FPGA), the same conversion multi_sensor_example.py aligns sensors with.
+While time sync is not valid the two clocks are unrelated, so those frames are
+counted as latency_unsynced instead of being observed.
+
+stats.snapshot() returns a dict; stats.to_openmetrics() renders the same data
+as Prometheus/OpenMetrics text, served on --metrics-port if given.
+
+Example usage:
+    python receive_stats_example.py
+    python receive_stats_example.py --metrics-port 9400 --report-every 5
+"""
+
+import argparse
+import bisect
+import http.server
+import threading
+import time
+
+from voyant_api import CarbonClient, CarbonConfig, init_voyant_logging
+
+# Histogram bucket upper bounds in seconds (Prometheus "le" buckets).
+LATENCY_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0)
+GAP_BUCKETS = (0.01, 0.025, 0.05, 0.075, 0.1, 0.15, 0.2, 0.5, 1.0)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Instrument the live receive path: latency, drops and backlog",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        metavar="PATH",
+        help=(
+            "Path to a JSON device config (e.g. config/device_config.json "
+            "with your sensor interface_addr). "
+            "If omitted, default CarbonConfig values are used."
+        ),
+    )
+    parser.add_argument(
+        "--report-every",
+        type=float,
+        default=10.0,
+        metavar="SEC",
+        help="Print a stats snapshot this often",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        metavar="PORT",
+        help="Serve OpenMetrics text on http://0.0.0.0:PORT/metrics",
+    )
+    return parser.parse_args()
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds, Prometheus style."""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self):
+        cumulative = []
+        total = 0
+        for le, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            cumulative.append((le, total))
+        return {"buckets": cumulative, "sum": self.sum, "count": self.count}
+
+
+class ReceiveStats:
+    """Wraps CarbonClient.try_receive_frame() and records receive-path metrics."""
+
+    def __init__(self, client: CarbonClient):
+        self._client = client
+        self._lock = threading.Lock()
+        self.polls = 0
+        self.empty_polls = 0
+        self.frames_received = 0
+        self.frames_missed = {"sequence_gap": 0, "out_of_order": 0}
+        self.latency_unsynced = 0
+        self.backlog = 0
+        self.backlog_high_water = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.frame_gap = Histogram(GAP_BUCKETS)
+        self._last_frame_index = None
+        self._last_receive = None
+
+    def try_receive_frame(self):
+        frame = self._client.try_receive_frame()
+        now = time.time()
+        sync = self._client.time_sync_state() if frame is not None else None
+        with self._lock:
+            self.polls += 1
+            if frame is None:
+                self.empty_polls += 1
+                self.backlog = 0
+                return None
+
+            self.frames_received += 1
+            self.backlog += 1
+            self.backlog_high_water = max(self.backlog_high_water, self.backlog)
+
+            if sync.valid:
+                # offset_ns is host - FPGA: it moves the sensor-clock
+                # timestamp onto the host clock.
+                host_time = frame.timestamp + sync.offset_ns * 1e-9
+                self.latency.observe(max(0.0, now - host_time))
+            else:
+                self.latency_unsynced += 1
+            if self._last_receive is not None:
+                self.frame_gap.observe(now - self._last_receive)
+            self._last_receive = now
+
+            if self._last_frame_index is not None:
+                expected = self._last_frame_index + 1
+                if frame.frame_index > expected:
+                    self.frames_missed["sequence_gap"] += frame.frame_index - expected
+                elif frame.frame_index < expected:
+                    self.frames_missed["out_of_order"] += 1
+            self._last_frame_index = frame.frame_index
+        return frame
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "polls": self.polls,
+                "empty_polls": self.empty_polls,
+                "frames_received": self.frames_received,
+                "frames_missed": dict(self.frames_missed),
+                "latency_unsynced": self.latency_unsynced,
+                "backlog_high_water": self.backlog_high_water,
+                "latency_seconds": self.latency.snapshot(),
+                "frame_gap_seconds": self.frame_gap.snapshot(),
+            }
+
+    def to_openmetrics(self, prefix="voyant_receive"):
+        snap = self.snapshot()
+        lines = []
+
+        def counter(name, help_text, samples):
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            for labels, value in samples:
+                lines.append(f"{prefix}_{name}_total{labels} {value}")
+
+        def histogram(name, help_text, hist):
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            for le, count in hist["buckets"]:
+                le_text = "+Inf" if le == float("inf") else repr(le)
+                lines.append(f'{prefix}_{name}_bucket{{le="{le_text}"}} {count}')
+            lines.append(f"{prefix}_{name}_sum {hist['sum']}")
+            lines.append(f"{prefix}_{name}_count {hist['count']}")
+
+        counter("polls", "Calls to try_receive_frame.", [("", snap["polls"])])
+        counter(
+            "empty_polls", "Calls that returned no frame.", [("", snap["empty_polls"])]
+        )
+        counter("frames", "Frames received.", [("", snap["frames_received"])])
+        counter(
+            "frames_missed",
+            "Frames missing from the frame_index sequence, by reason.",
+            [(f'{{reason="{r}"}}', n) for r, n in snap["frames_missed"].items()],
+        )
+        counter(
+            "latency_unsynced",
+            "Frames received without valid time sync, left out of latency.",
+            [("", snap["latency_unsynced"])],
+        )
+        lines.append(f"# TYPE {prefix}_backlog_high_water gauge")
+        lines.append(
+            f"# HELP {prefix}_backlog_high_water "
+            "Most frames drained back to back without the client running dry."
+        )
+        lines.append(f"{prefix}_backlog_high_water {snap['backlog_high_water']}")
+        histogram(
+            "latency_seconds",
+            "Host receive time minus frame timestamp on the host clock.",
+            snap["latency_seconds"],
+        )
+        histogram(
+            "frame_gap_seconds",
+            "Time between consecutive received frames.",
+            snap["frame_gap_seconds"],
+        )
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def serve_metrics(stats, port):
+    """Serve stats.to_openmetrics() at /metrics on a daemon thread."""
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802 (http.server naming)
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = stats.to_openmetrics().encode()
+            self.send_response(200)
+            self.send_header(
+                "Content-Type",
+                "application/openmetrics-text; version=1.0.0; charset=utf-8",
+            )
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("0.0.0.0", port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    config = CarbonConfig.from_json(args.config) if args.config else CarbonConfig()
+    print("Using config:")
+    print(config)
+    print()
+
+    print("Starting CarbonClient...")
+    print("Press Ctrl+C to stop\n")
+
+    client = CarbonClient(config)
+    client.start()
+    stats = ReceiveStats(client)
+    if args.metrics_port is not None:
+        serve_metrics(stats, args.metrics_port)
+        print(f"Serving metrics on http://0.0.0.0:{args.metrics_port}/metrics\n")
+
+    next_report = time.monotonic() + args.report_every
+    try:
+        while client.is_running():
+            frame = stats.try_receive_frame()
+
+            if frame is not None:
+                ###############################################
+                # Insert your point cloud processing magic here
+                ###############################################
+                pass
+            else:
+                # No frame available
+                time.sleep(0.001)
+
+            if time.monotonic() >= next_report:
+                next_report += args.report_every
+                snap = stats.snapshot()
+                latency = snap["latency_seconds"]
+                mean_ms = 1e3 * latency["sum"] / max(1, latency["count"])
+                print(
+                    f"Frames {snap['frames_received']}, missed {snap['frames_missed']}, "
+                    f"backlog high-water {snap['backlog_high_water']}, "
+                    f"mean latency {mean_ms:.1f} ms "
+                    f"({snap['latency_unsynced']} frames unsynced), "
+                    f"empty polls {snap['empty_polls']}/{snap['polls']}"
+                )
+                print(f"Time sync: {client.time_sync_state()}\n")
+
+    except KeyboardInterrupt:
+        print("\nFinal receive stats:")
+        print(stats.to_openmetrics())
+    finally:
+        client.stop()
+
+
+if __name__ == "__main__":
+    main()
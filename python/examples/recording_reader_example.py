@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Look up frames in a Voyant recording through a cached frame index.
+
+VoyantPlayback only reads forward, so finding a frame by sensor frame index or
+by time means scanning the file every time. VoyantRecordingReader scans the
+recording once, stores the position, sensor frame index and timestamp of every
+frame in a sidecar file (<recording>.index.json) and reuses it on later opens.
+Lookups by position, frame index or time are then answered from the index:
+  - reader[i] / reader[i:j]       frames by position in the recording
+  - reader.seek_frame_index(n)    position of sensor frame index n
+  - reader.seek_time(t)           position of the first frame at or after t
+
+This is not random access. VoyantPlayback has no seek, so reading a frame
+still decodes every frame before it: forward from the last frame read, or from
+the start of the file when seeking backwards. The index makes finding a frame
+O(1) and lets you know the range before reading. It does not make reading
+frame n cheaper than a scan up to n. Walking a window in order costs one pass
+over the file up to the end of the window.
+
+Compressed recordings (.cz, see compressed_recording_example.py) open
+transparently: they are decompressed in full to a temporary file first.
+
+Example usage:
+    python recording_reader_example.py --input recording.vynt
+    python recording_reader_example.py --input recording.vynt --frame-index 1000 --count 10
+    python recording_reader_example.py --input recording.vynt --time 1691391379.5
+"""
+
+import argparse
+import bisect
+import contextlib
+import json
+import os
+from itertools import islice
+
+from voyant_api import init_voyant_logging
+
+from compressed_recording_example import open_recording
+
+INDEX_SUFFIX = ".index.json"
+INDEX_VERSION = 1
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Look up frames in a Voyant recording through a cached frame index",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        required=True,
+        help="Path to the Voyant recording file (.vynt, .bin or .cz)",
+    )
+    start = parser.add_mutually_exclusive_group()
+    start.add_argument(
+        "--frame-index",
+        type=int,
+        default=None,
+        help="Start at this sensor frame index",
+    )
+    start.add_argument(
+        "--time",
+        type=float,
+        default=None,
+        metavar="SEC",
+        help="Start at the first frame at or after this timestamp (seconds since epoch)",
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=5,
+        help="Number of frames to print from the start position",
+    )
+    parser.add_argument(
+        "--rebuild-index",
+        action="store_true",
+        default=False,
+        help="Ignore any cached index and rescan the recording",
+    )
+    parser.add_argument(
+        "--keep-invalid-points",
+        action="store_true",
+        default=False,
+        help="Keep invalid points (disable filtering)",
+    )
+    return parser.parse_args()
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def build_index(path, filter_points=True, playback=None):
+    """Scan a recording once and return its frame indices and timestamps.
+
+    If an open playback of the recording is given it is scanned and then
+    reset, instead of opening (and for .cz, decompressing) the file again.
+    """
+    with contextlib.ExitStack() as stack:
+        if playback is None:
+            playback = stack.enter_context(
+                open_recording(path, filter_points=filter_points)
+            )
+        frame_indices = []
+        timestamps = []
+        for frame in playback:
+            if frame is None:
+                break
+            frame_indices.append(frame.frame_index)
+            timestamps.append(frame.timestamp)
+        playback.reset()
+    return frame_indices, timestamps
+
+
+def load_index(path, filter_points=True, rebuild=False, playback=None):
+    """Load the sidecar index for a recording, building it if missing or stale.
+
+    playback is passed on to build_index().
+    """
+    index_path = path + INDEX_SUFFIX
+    signature = _file_signature(path)
+
+    if not rebuild and os.path.exists(index_path):
+        with open(index_path) as f:
+            cached = json.load(f)
+        if cached.get("version") == INDEX_VERSION and cached.get("file") == signature:
+            return cached["frame_indices"], cached["timestamps"]
+
+    frame_indices, timestamps = build_index(
+        path, filter_points=filter_points, playback=playback
+    )
+    try:
+        with open(index_path, "w") as f:
+            json.dump(
+                {
+                    "version": INDEX_VERSION,
+                    "file": signature,
+                    "frame_indices": frame_indices,
+                    "timestamps": timestamps,
+                },
+                f,
+            )
+    except OSError as exc:
+        # A read-only recording directory only costs a rescan next time.
+        print(f"Could not write frame index '{index_path}': {exc}")
+    return frame_indices, timestamps
+
+
+class VoyantRecordingReader:
+    """Indexed view of a single Voyant recording.
+
+    Seeking only moves the position; the next read decodes forward to it.
+    """
+
+    def __init__(self, path, filter_points=True, rebuild_index=False):
+        self.path = path
+        # Owns the playback and, for a .cz file, its decompressed copy, which
+        # also serves the index scan.
+        self._stack = contextlib.ExitStack()
+        self._playback = self._stack.enter_context(
+            open_recording(path, filter_points=filter_points)
+        )
+        try:
+            self.frame_indices, self.timestamps = load_index(
+                path,
+                filter_points=filter_points,
+                rebuild=rebuild_index,
+                playback=self._playback,
+            )
+        except BaseException:
+            self._stack.close()
+            raise
+        self._position_by_frame_index = {
+            frame_index: position
+            for position, frame_index in enumerate(self.frame_indices)
+        }
+        # Position of the frame the next call to the playback iterator returns.
+        self._next_position = 0
+        self.position = 0
+
+    def __len__(self):
+        return len(self.frame_indices)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def close(self):
+        self._stack.close()
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._read_at(i) for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError(f"frame position {key} out of range (0..{len(self) - 1})")
+        return self._read_at(key)
+
+    def __iter__(self):
+        while self.position < len(self):
+            frame = self._read_at(self.position)
+            self.position += 1
+            yield frame
+
+    def _read_at(self, position):
+        if position < self._next_position:
+            self._playback.reset()
+            self._next_position = 0
+        frame = None
+        while self._next_position <= position:
+            # StopIteration must not escape: inside __iter__ it would become
+            # a RuntimeError (PEP 479).
+            frame = next(self._playback, None)
+            if frame is None:
+                raise IOError(
+                    f"'{self.path}' ended before frame position {position}; "
+                    "the index is stale, rebuild it"
+                )
+            self._next_position += 1
+        return frame
+
+    def seek_frame_index(self, frame_index):
+        """Move to the frame with this sensor frame index and return its position.
+
+        If the frame index repeats (e.g. the sensor restarted mid-recording),
+        the last frame with it is used.
+
+        Raises:
+            KeyError: If no frame in the recording has this frame index.
+        """
+        self.position = self._position_by_frame_index[frame_index]
+        return self.position
+
+    def seek_time(self, timestamp):
+        """Move to the first frame at or after a timestamp and return its position.
+
+        Returns len(self) if every frame is earlier than the timestamp.
+        """
+        self.position = bisect.bisect_left(self.timestamps, timestamp)
+        return self.position
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    with VoyantRecordingReader(
+        args.input,
+        filter_points=not args.keep_invalid_points,
+        rebuild_index=args.rebuild_index,
+    ) as reader:
+        print(f"'{args.input}': {len(reader)} frames")
+        if len(reader) == 0:
+            return
+        print(
+            f"Frame index {reader.frame_indices[0]}..{reader.frame_indices[-1]}, "
+            f"time {reader.timestamps[0]:.3f}..{reader.timestamps[-1]:.3f} s\n"
+        )
+
+        if args.frame_index is not None:
+            try:
+                reader.seek_frame_index(args.frame_index)
+            except KeyError:
+                print(f"No frame with sensor frame index {args.frame_index}")
+                return
+        elif args.time is not None:
+            reader.seek_time(args.time)
+
+        start = reader.position
+        for position, frame in enumerate(islice(reader, args.count), start):
+            print(f"[{position}] {frame}")
+
+            ###############################################
+            # Insert your point cloud processing magic here
+            ###############################################
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Read the split files of one recording session as a single seekable stream.
+
+VoyantRecorder splits long captures into many files (--frames-per-file,
+--duration-per-file, --size-per-file-mb), each with its own timestamped name,
+while VoyantPlayback opens one file at a time. RecordingSet takes the base path
+given to the recorder, finds every split file of that session, orders them by
+their first frame timestamp and merges their frame indexes (the cached
+<file>.index.json sidecars of recording_reader_example.py) into one.
+
+The set supports the same lookups as VoyantRecordingReader:
+  - recordings[i] / recordings[i:j]   frames by position across all files
+  - recordings.seek_frame_index(n)    position of sensor frame index n
+  - recordings.seek_time(t)           position of the first frame at or after t
+
+While one file is being read, the next one is opened and its first frame
+decoded on a background thread, so crossing a split boundary does not stall.
+Compressed split files (.cz, see compressed_recording_example.py) are
+decompressed in full to a temporary file when opened, also on that thread.
+
+Example usage:
+    python recording_set_example.py --input recording.vynt
+    python recording_set_example.py --input recording.vynt --time 1691391379.5 --count 100
+    python recording_set_example.py --input recording_20250101_000000.000.vynt
+"""
+
+import argparse
+import bisect
+import contextlib
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from voyant_api import init_voyant_logging
+
+from compressed_recording_example import COMPRESSED_SUFFIX, open_recording
+from recording_reader_example import VoyantRecordingReader, load_index
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Read the split files of one recording session as a single stream",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        required=True,
+        help=(
+            "Base output path given to the recorder (e.g. recording.vynt), "
+            "or any split file of the session to read"
+        ),
+    )
+    start = parser.add_mutually_exclusive_group()
+    start.add_argument(
+        "--frame-index",
+        type=int,
+        default=None,
+        help="Start at this sensor frame index",
+    )
+    start.add_argument(
+        "--time",
+        type=float,
+        default=None,
+        metavar="SEC",
+        help="Start at the first frame at or after this timestamp (seconds since epoch)",
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=None,
+        help="Number of frames to read from the start position (None = to the end)",
+    )
+    parser.add_argument(
+        "--no-prefetch",
+        action="store_true",
+        default=False,
+        help="Open each split file only when the stream reaches it",
+    )
+    parser.add_argument(
+        "--rebuild-index",
+        action="store_true",
+        default=False,
+        help="Ignore any cached indexes and rescan the recordings",
+    )
+    parser.add_argument(
+        "--keep-invalid-points",
+        action="store_true",
+        default=False,
+        help="Keep invalid points (disable filtering)",
+    )
+    return parser.parse_args()
+
+
+# Recorder output names: <stem>[_<YYYYMMDD_HHMMSS>][.<NNN>]<ext>, optionally
+# compressed to <name>.cz by compressed_recording_example.py.
+_SPLIT_NAME = re.compile(
+    r"(?P<stem>.+?)(?:_(?P<session>\d{8}_\d{6}))?(?:\.(?P<split>\d{3,}))?"
+    r"(?P<ext>\.[^.]+)(?:" + re.escape(COMPRESSED_SUFFIX) + r")?$"
+)
+
+
+def discover_split_files(path):
+    """Find the files a recorder wrote for one recording session.
+
+    The recorder names its files <stem>_<YYYYMMDD_HHMMSS>.<NNN><ext>, where
+    the timestamp identifies the session and NNN the split; either part is
+    absent when timestamps or splitting are disabled. path is either the base
+    path given to the recorder, or any one file of the session to select that
+    session. Only names of exactly that form match, so "rec.vynt" does not pick
+    up "record.vynt" or "rec_old.vynt". When both a split file and its .cz copy
+    exist, the uncompressed file is used.
+
+    Raises:
+        ValueError: If path is a base path and files of several sessions match.
+    """
+    directory, name = os.path.split(path)
+    wanted = _SPLIT_NAME.match(name)
+    if wanted is None:
+        return []
+    # A base path matches every session written for it; a split file only its own.
+    any_session = wanted["session"] is None and wanted["split"] is None
+
+    sessions = {}
+    for entry in os.listdir(directory or "."):
+        match = _SPLIT_NAME.match(entry)
+        if (
+            match is None
+            or match["stem"] != wanted["stem"]
+            or match["ext"] != wanted["ext"]
+            or (not any_session and match["session"] != wanted["session"])
+            or not os.path.isfile(os.path.join(directory, entry))
+        ):
+            continue
+        files = sessions.setdefault(match["session"], {})
+        split = match["split"]
+        # Prefer the plain file over its compressed copy.
+        if split not in files or not entry.endswith(COMPRESSED_SUFFIX):
+            files[split] = os.path.join(directory, entry)
+
+    if len(sessions) > 1:
+        listing = "\n".join(
+            f"  {session or '(no timestamp)'}: {sorted(files.values())[0]}"
+            for session, files in sorted(sessions.items(), key=lambda s: s[0] or "")
+        )
+        raise ValueError(
+            f"'{path}' matches {len(sessions)} recording sessions; pass one file "
+            f"of the session to read:\n{listing}"
+        )
+    files = next(iter(sessions.values()), {})
+    return [files[split] for split in sorted(files, key=lambda split: split or "")]
+
+
+class RecordingSet(VoyantRecordingReader):
+    """Indexed, seekable view of all split files of one recording session."""
+
+    def __init__(self, paths, filter_points=True, rebuild_index=False, prefetch=True):
+        """
+        Args:
+            paths: Base output path given to the recorder, or a list of files
+            filter_points: Whether to filter out invalid points
+            rebuild_index: Ignore cached indexes and rescan every file
+            prefetch: Open the next file on a background thread
+        """
+        if isinstance(paths, str):
+            self.path = paths
+            paths = discover_split_files(paths)
+        else:
+            self.path = paths[0] if paths else None
+        if not paths:
+            raise FileNotFoundError(f"No recording files found for '{self.path}'")
+
+        segments = []
+        for path in paths:
+            frame_indices, timestamps = load_index(
+                path, filter_points=filter_points, rebuild=rebuild_index
+            )
+            if timestamps:
+                segments.append((timestamps[0], path, frame_indices, timestamps))
+        segments.sort(key=lambda segment: segment[0])
+
+        self.paths = []
+        self.frame_indices = []
+        self.timestamps = []
+        # Position of the first frame of each file in the merged index.
+        self.file_starts = []
+        for _, path, frame_indices, timestamps in segments:
+            self.paths.append(path)
+            self.file_starts.append(len(self.frame_indices))
+            self.frame_indices.extend(frame_indices)
+            self.timestamps.extend(timestamps)
+
+        self._position_by_frame_index = {
+            frame_index: position
+            for position, frame_index in enumerate(self.frame_indices)
+        }
+
+        self._filter_points = filter_points
+        self._prefetcher = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="voyant-prefetch")
+            if prefetch
+            else None
+        )
+        self._prefetched = None  # (file number, future of _open_file)
+        self._file_no = None
+        self._stack = None
+        self._playback = None
+        # First frame of the current file, decoded when it was opened.
+        self._lookahead = None
+        # Position within the current file of the frame _next_frame returns.
+        self._next_position = 0
+        self.position = 0
+
+    def close(self):
+        self._close_playback()
+        if self._prefetched is not None:
+            _, future = self._prefetched
+            self._prefetched = None
+            stack, _, _ = future.result()
+            stack.close()
+        if self._prefetcher is not None:
+            self._prefetcher.shutdown(wait=True)
+
+    def _close_playback(self):
+        if self._stack is not None:
+            self._stack.close()
+            self._stack = None
+            self._playback = None
+            self._file_no = None
+
+    def _open_file(self, file_no):
+        """Open a file; returns (stack owning the playback, playback, first frame)."""
+        stack = contextlib.ExitStack()
+        try:
+            playback = stack.enter_context(
+                open_recording(self.paths[file_no], filter_points=self._filter_points)
+            )
+            return stack, playback, next(playback, None)
+        except BaseException:
+            stack.close()
+            raise
+
+    def _switch_to(self, file_no):
+        self._close_playback()
+        opened = None
+        if self._prefetched is not None:
+            prefetched_no, future = self._prefetched
+            self._prefetched = None
+            if prefetched_no == file_no:
+                opened = future.result()
+            else:
+                # A seek skipped the prefetched file.
+                future.result()[0].close()
+        if opened is None:
+            opened = self._open_file(file_no)
+
+        self._stack, self._playback, self._lookahead = opened
+        self._file_no = file_no
+        self._next_position = 0
+
+        if self._prefetcher is not None and file_no + 1 < len(self.paths):
+            self._prefetched = (
+                file_no + 1,
+                self._prefetcher.submit(self._open_file, file_no + 1),
+            )
+
+    def _next_frame(self):
+        if self._lookahead is not None:
+            frame, self._lookahead = self._lookahead, None
+        else:
+            # None at end of file; _read_at reports it as a stale index.
+            frame = next(self._playback, None)
+        self._next_position += 1
+        return frame
+
+    def _read_at(self, position):
+        file_no = bisect.bisect_right(self.file_starts, position) - 1
+        local = position - self.file_starts[file_no]
+        if file_no != self._file_no:
+            self._switch_to(file_no)
+        elif local < self._next_position:
+            self._playback.reset()
+            self._lookahead = None
+            self._next_position = 0
+
+        frame = None
+        while self._next_position <= local:
+            frame = self._next_frame()
+            if frame is None:
+                raise IOError(
+                    f"'{self.paths[file_no]}' ended before frame position {local}; "
+                    "the index is stale, rebuild it"
+                )
+        return frame
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    try:
+        recordings = RecordingSet(
+            args.input,
+            filter_points=not args.keep_invalid_points,
+            rebuild_index=args.rebuild_index,
+            prefetch=not args.no_prefetch,
+        )
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+
+    with recordings:
+        print(
+            f"'{args.input}': {len(recordings)} frames in {len(recordings.paths)} files"
+        )
+        for path, start in zip(recordings.paths, recordings.file_starts):
+            print(f"  [{start}] {path}")
+        if len(recordings) == 0:
+            return
+        print(
+            f"Time {recordings.timestamps[0]:.3f}..{recordings.timestamps[-1]:.3f} s\n"
+        )
+
+        if args.frame_index is not None:
+            try:
+                recordings.seek_frame_index(args.frame_index)
+            except KeyError:
+                print(f"No frame with sensor frame index {args.frame_index}")
+                return
+        elif args.time is not None:
+            recordings.seek_time(args.time)
+
+        start = recordings.position
+        for position, frame in enumerate(islice(recordings, args.count), start):
+            print(f"[{position}] {frame}")
+
+            ###############################################
+            # Insert your point cloud processing magic here
+            ###############################################
+
+
+if __name__ == "__main__":
+    main()
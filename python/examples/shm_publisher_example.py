@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Share live frames with other processes on this host through shared memory.
+
+Only one CarbonClient can bind the sensor stream. In `publish` mode this
+example runs that client and writes every frame into a ring of --slots slots
+in a named shared-memory block. Any number of processes can then run
+`subscribe` mode (or use ShmSubscriber) on the same --name: they map the ring
+and read frames in place, with no socket, serialization or copy on their side.
+
+Each slot carries a sequence number that the publisher makes odd while it
+writes the slot and even once the slot is complete (a seqlock), so readers
+never see a half-written frame and never block the publisher. Each subscriber
+keeps its own position in the stream and counts:
+  - frames_received
+  - frames_dropped: frames overwritten before the subscriber got to them
+  - lag / max_lag:  how many frames the subscriber is behind the publisher
+
+ShmFrame.xyzv() is a read-only view into the ring. It stays valid until the
+publisher wraps around to that slot; check frame.is_valid() after processing
+if the consumer may run more than --slots frames behind.
+
+Example usage:
+    python shm_publisher_example.py publish --config config/device_config.json
+    python shm_publisher_example.py subscribe
+    python shm_publisher_example.py publish --sim --slots 16 --max-points 300000
+"""
+
+import argparse
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+from voyant_api import CarbonClient, CarbonConfig, init_voyant_logging
+
+DEFAULT_NAME = "voyant-frames"
+MAGIC = 0x564F59414E543031  # "VOYANT01"
+
+HEADER_DTYPE = np.dtype(
+    [
+        ("magic", np.uint64),
+        ("n_slots", np.uint64),
+        ("max_points", np.uint64),
+        ("write_seq", np.uint64),
+    ]
+)
+SLOT_HEADER_DTYPE = np.dtype(
+    [
+        ("seq", np.uint64),
+        ("frame_index", np.uint64),
+        ("timestamp", np.float64),
+        ("n_points", np.uint64),
+    ]
+)
+POINT_BYTES = 4 * np.dtype(np.float32).itemsize
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Share live frames with other processes through shared memory",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+
+    publish = subparsers.add_parser(
+        "publish",
+        help="Receive from the sensor and publish every frame",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    publish.add_argument(
+        "--config",
+        type=str,
+        metavar="PATH",
+        help=(
+            "Path to a JSON device config (e.g. config/device_config.json "
+            "with your sensor interface_addr). "
+            "If omitted, default CarbonConfig values are used."
+        ),
+    )
+    publish.add_argument(
+        "--sim",
+        action="store_true",
+        help="Receive from a local carbon_simulator on loopback.",
+    )
+    publish.add_argument(
+        "--slots",
+        type=int,
+        default=8,
+        help="Frames held in the ring",
+    )
+    publish.add_argument(
+        "--max-points",
+        type=int,
+        default=200_000,
+        help="Largest frame a slot can hold; larger frames are truncated",
+    )
+
+    subscribe = subparsers.add_parser(
+        "subscribe",
+        help="Read frames published by another process",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    subscribe.add_argument(
+        "--report-every",
+        type=float,
+        default=5.0,
+        metavar="SEC",
+        help="Print subscriber stats this often",
+    )
+
+    for sub in (publish, subscribe):
+        sub.add_argument(
+            "--name",
+            type=str,
+            default=DEFAULT_NAME,
+            help="Name of the shared-memory block",
+        )
+    return parser.parse_args()
+
+
+def _layout(buf, n_slots, max_points):
+    """Header, slot headers and per-slot point arrays as views of a buffer."""
+    header = np.ndarray((), dtype=HEADER_DTYPE, buffer=buf)
+    slot_size = SLOT_HEADER_DTYPE.itemsize + max_points * POINT_BYTES
+    slot_headers = []
+    slot_points = []
+    for slot in range(n_slots):
+        offset = HEADER_DTYPE.itemsize + slot * slot_size
+        slot_headers.append(
+            np.ndarray((), dtype=SLOT_HEADER_DTYPE, buffer=buf, offset=offset)
+        )
+        slot_points.append(
+            np.ndarray(
+                (max_points, 4),
+                dtype=np.float32,
+                buffer=buf,
+                offset=offset + SLOT_HEADER_DTYPE.itemsize,
+            )
+        )
+    return header, slot_headers, slot_points
+
+
+def _ring_size(n_slots, max_points):
+    slot_size = SLOT_HEADER_DTYPE.itemsize + max_points * POINT_BYTES
+    return HEADER_DTYPE.itemsize + n_slots * slot_size
+
+
+class ShmPublisher:
+    """Writes frames into a shared-memory ring for ShmSubscribers to read."""
+
+    def __init__(self, name=DEFAULT_NAME, n_slots=8, max_points=200_000):
+        self.name = name
+        self.n_slots = n_slots
+        self.max_points = max_points
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True, size=_ring_size(n_slots, max_points)
+        )
+        self._header, self._slot_headers, self._slot_points = _layout(
+            self._shm.buf, n_slots, max_points
+        )
+        self._header["n_slots"] = n_slots
+        self._header["max_points"] = max_points
+        self._header["write_seq"] = 0
+        # Written last: subscribers wait for it before trusting the layout.
+        self._header["magic"] = MAGIC
+        self.frames_published = 0
+        self.frames_truncated = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def close(self):
+        del self._header, self._slot_headers, self._slot_points
+        self._shm.unlink()
+        self._shm.close()
+
+    def publish(self, frame):
+        """Copy a frame into the next slot."""
+        xyzv = frame.xyzv()
+        n_points = len(xyzv)
+        if n_points > self.max_points:
+            self.frames_truncated += 1
+            n_points = self.max_points
+
+        seq = int(self._header["write_seq"])
+        slot = seq % self.n_slots
+        slot_header = self._slot_headers[slot]
+        slot_header["seq"] = 2 * seq + 1
+        self._slot_points[slot][:n_points] = xyzv[:n_points]
+        slot_header["frame_index"] = frame.frame_index
+        slot_header["timestamp"] = frame.timestamp
+        slot_header["n_points"] = n_points
+        slot_header["seq"] = 2 * seq + 2
+        self._header["write_seq"] = seq + 1
+        self.frames_published += 1
+
+
+class ShmFrame:
+    """A frame read in place from the shared-memory ring."""
+
+    def __init__(self, subscriber, seq, frame_index, timestamp, xyzv):
+        self._subscriber = subscriber
+        self.seq = seq
+        self.frame_index = frame_index
+        self.timestamp = timestamp
+        self.n_points = len(xyzv)
+        self._xyzv = xyzv
+
+    def xyzv(self):
+        """Read-only (N, 4) view of x, y, z, radial velocity in the ring."""
+        return self._xyzv
+
+    def is_valid(self):
+        """False once the publisher has started overwriting this frame's slot."""
+        return self._subscriber._slot_seq(self.seq) == 2 * self.seq + 2
+
+    def __repr__(self):
+        return (
+            f"ShmFrame(frame_index={self.frame_index}, "
+            f"timestamp={self.timestamp:.6f}, n_points={self.n_points})"
+        )
+
+
+class ShmSubscriber:
+    """Maps a publisher's ring and yields its frames without copying them."""
+
+    def __init__(self, name=DEFAULT_NAME, timeout=10.0):
+        """
+        Args:
+            name: Name of the publisher's shared-memory block
+            timeout: Seconds to wait for the publisher to create the block
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                self._shm = shared_memory.SharedMemory(name=name)
+                break
+            except FileNotFoundError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+        # Python < 3.13 registers attached blocks with the resource tracker,
+        # which would unlink the publisher's block when this process exits.
+        resource_tracker.unregister(self._shm._name, "shared_memory")
+
+        header = np.ndarray((), dtype=HEADER_DTYPE, buffer=self._shm.buf)
+        while header["magic"] != MAGIC:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"shared memory '{name}' was never initialized")
+            time.sleep(0.01)
+        self.n_slots = int(header["n_slots"])
+        self._header, self._slot_headers, self._slot_points = _layout(
+            self._shm.buf, self.n_slots, int(header["max_points"])
+        )
+        # Start with the next frame published.
+        self._next_seq = int(self._header["write_seq"])
+        self.frames_received = 0
+        self.frames_dropped = 0
+        self.lag = 0
+        self.max_lag = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def close(self):
+        del self._header, self._slot_headers, self._slot_points
+        try:
+            self._shm.close()
+        except BufferError:
+            # ShmFrames still referenced by the caller keep the mapping alive;
+            # it is released when they are.
+            pass
+
+    def _slot_seq(self, seq):
+        return int(self._slot_headers[seq % self.n_slots]["seq"])
+
+    def try_receive_frame(self):
+        """Return the next unread frame, or None if the subscriber is caught up."""
+        while True:
+            write_seq = int(self._header["write_seq"])
+            if self._next_seq >= write_seq:
+                self.lag = 0
+                return None
+            oldest = write_seq - self.n_slots
+            if self._next_seq < oldest:
+                # The publisher has lapped us; skip to the oldest frame kept.
+                self.frames_dropped += oldest - self._next_seq
+                self._next_seq = oldest
+
+            seq = self._next_seq
+            slot = seq % self.n_slots
+            slot_header = self._slot_headers[slot]
+            if int(slot_header["seq"]) != 2 * seq + 2:
+                # Overwritten between reading write_seq and here.
+                continue
+            frame = ShmFrame(
+                self,
+                seq,
+                int(slot_header["frame_index"]),
+                float(slot_header["timestamp"]),
+                self._slot_points[slot][: int(slot_header["n_points"])],
+            )
+            if int(slot_header["seq"]) != 2 * seq + 2:
+                continue
+            frame._xyzv.flags.writeable = False
+
+            self._next_seq = seq + 1
+            self.frames_received += 1
+            self.lag = write_seq - self._next_seq
+            self.max_lag = max(self.max_lag, self.lag)
+            return frame
+
+    def frames(self, poll_interval=0.001):
+        """Iterate over frames as they are published."""
+        while True:
+            frame = self.try_receive_frame()
+            if frame is None:
+                time.sleep(poll_interval)
+                continue
+            yield frame
+
+
+def publish(args):
+    config = CarbonConfig.from_json(args.config) if args.config else CarbonConfig()
+    if args.sim:
+        config.set_interface_addr("127.0.0.1")
+        config.set_fpga_target_addr("127.0.0.1:1234")
+
+    client = CarbonClient(config)
+    client.start()
+    with ShmPublisher(args.name, args.slots, args.max_points) as publisher:
+        print(f"Publishing frames to shared memory '{args.name}'. Press Ctrl+C to stop")
+        try:
+            while client.is_running():
+                frame = client.try_receive_frame()
+                if frame is None:
+                    time.sleep(0.001)
+                    continue
+                publisher.publish(frame)
+        except KeyboardInterrupt:
+            print(
+                f"\nPublished {publisher.frames_published} frames "
+                f"({publisher.frames_truncated} truncated)"
+            )
+        finally:
+            client.stop()
+
+
+def subscribe(args):
+    with ShmSubscriber(args.name) as subscriber:
+        print(f"Subscribed to shared memory '{args.name}'. Press Ctrl+C to stop")
+        next_report = time.monotonic() + args.report_every
+        try:
+            for frame in subscriber.frames():
+                print(frame)
+
+                ###############################################
+                # Insert your point cloud processing magic here
+                ###############################################
+
+                if time.monotonic() >= next_report:
+                    next_report += args.report_every
+                    print(
+                        f"Received {subscriber.frames_received}, "
+                        f"dropped {subscriber.frames_dropped}, "
+                        f"lag {subscriber.lag} (max {subscriber.max_lag})"
+                    )
+        except KeyboardInterrupt:
+            print(
+                f"\nReceived {subscriber.frames_received} frames, "
+                f"dropped {subscriber.frames_dropped}, max lag {subscriber.max_lag}"
+            )
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    if args.mode == "publish":
+        publish(args)
+    else:
+        subscribe(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024-2025 Voyant Photonics, Inc.
+#
+# This example code is licensed under the MIT License.
+# See the LICENSE file in the repository root for full license text.
+
+"""
+Vectorized spatial reductions of Voyant point clouds with NumPy.
+
+All functions take an (N, 4) array of x, y, z, radial velocity (frame.xyzv(),
+or several frames stacked, e.g. the points array of batch_drain_example.py)
+plus an optional (N,) linear SNR array, and never loop over points in Python:
+  - voxel_downsample():   one row per occupied voxel with the centroid, point
+                          count and radial velocity / SNR statistics, so the
+                          FMCW-specific information survives downsampling
+  - range_azimuth_bins(): point counts and mean radial velocity on a polar
+                          (range, azimuth) grid
+  - OccupancyGrid:        x/y hit counts accumulated over frames
+
+frame_points() gets the arrays for one frame or a list of frames.
+
+Example usage:
+    python spatial_example.py --input recording.vynt --voxel-size 0.2
+    python spatial_example.py --input recording.vynt --batch-frames 10 --grid-resolution 0.5
+"""
+
+import argparse
+
+import numpy as np
+from voyant_api import VoyantPlayback, init_voyant_logging
+
+VOXEL_DTYPE = np.dtype(
+    [
+        ("x", np.float32),
+        ("y", np.float32),
+        ("z", np.float32),
+        ("count", np.uint32),
+        ("radial_vel_mean", np.float32),
+        ("radial_vel_std", np.float32),
+        ("radial_vel_min", np.float32),
+        ("radial_vel_max", np.float32),
+        ("snr_mean", np.float32),
+        ("snr_max", np.float32),
+    ]
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Vectorized spatial reductions of Voyant point clouds",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        required=True,
+        help="Path to the Voyant recording file (.vynt or .bin)",
+    )
+    parser.add_argument(
+        "--voxel-size",
+        type=float,
+        default=0.2,
+        metavar="M",
+        help="Edge length of the downsampling voxels",
+    )
+    parser.add_argument(
+        "--batch-frames",
+        type=int,
+        default=1,
+        help="Number of frames stacked before each reduction",
+    )
+    parser.add_argument(
+        "--range-resolution",
+        type=float,
+        default=1.0,
+        metavar="M",
+        help="Range bin size of the polar grid",
+    )
+    parser.add_argument(
+        "--azimuth-resolution",
+        type=float,
+        default=1.0,
+        metavar="DEG",
+        help="Azimuth bin size of the polar grid",
+    )
+    parser.add_argument(
+        "--range-max",
+        type=float,
+        default=100.0,
+        metavar="M",
+        help="Outer edge of the polar grid and half-width of the occupancy grid",
+    )
+    parser.add_argument(
+        "--grid-resolution",
+        type=float,
+        default=0.5,
+        metavar="M",
+        help="Cell size of the occupancy grid",
+    )
+    return parser.parse_args()
+
+
+def frame_points(frames):
+    """Stacked xyzv and linear SNR arrays of one frame or a list of frames.
+
+    Returns:
+        Tuple (points, snr): (N, 4) float32 x, y, z, radial velocity and (N,)
+        float32 snr_linear
+    """
+    if not isinstance(frames, (list, tuple)):
+        frames = [frames]
+    points = []
+    snr = []
+    for frame in frames:
+        # valid_points() columns: x, y, z, radial_vel, snr_linear, ...
+        valid = frame.valid_points()
+        points.append(valid[:, :4])
+        snr.append(valid[:, 4])
+    if not points:
+        return np.empty((0, 4), dtype=np.float32), np.empty(0, dtype=np.float32)
+    return np.concatenate(points), np.concatenate(snr)
+
+
+def voxel_downsample(points, voxel_size, snr=None):
+    """Reduce points to one row per occupied voxel.
+
+    Args:
+        points: (N, 4) array of x, y, z, radial velocity
+        voxel_size: Voxel edge length (meters)
+        snr: Optional (N,) linear SNR per point; snr_mean / snr_max are NaN
+            without it
+
+    Returns:
+        Structured array of VOXEL_DTYPE, one row per occupied voxel, sorted by
+        voxel coordinate
+    """
+    points = np.asarray(points)
+    if len(points) == 0:
+        return np.empty(0, dtype=VOXEL_DTYPE)
+
+    cells = np.floor(points[:, :3] / voxel_size).astype(np.int64)
+    # One int64 key per voxel, so np.unique works on a flat array.
+    cells -= cells.min(axis=0)
+    dims = cells.max(axis=0) + 1
+    keys = np.ravel_multi_index(cells.T, dims)
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    n_voxels = len(counts)
+
+    def voxel_sum(values):
+        return np.bincount(inverse, weights=values, minlength=n_voxels)
+
+    out = np.empty(n_voxels, dtype=VOXEL_DTYPE)
+    out["count"] = counts
+    for axis, name in enumerate("xyz"):
+        out[name] = voxel_sum(points[:, axis]) / counts
+
+    vel = points[:, 3].astype(np.float64)
+    vel_mean = voxel_sum(vel) / counts
+    out["radial_vel_mean"] = vel_mean
+    out["radial_vel_std"] = np.sqrt(
+        np.maximum(voxel_sum(vel * vel) / counts - vel_mean * vel_mean, 0.0)
+    )
+    vel_min = np.full(n_voxels, np.inf)
+    vel_max = np.full(n_voxels, -np.inf)
+    np.minimum.at(vel_min, inverse, vel)
+    np.maximum.at(vel_max, inverse, vel)
+    out["radial_vel_min"] = vel_min
+    out["radial_vel_max"] = vel_max
+
+    if snr is None:
+        out["snr_mean"] = np.nan
+        out["snr_max"] = np.nan
+    else:
+        snr = np.asarray(snr, dtype=np.float64)
+        out["snr_mean"] = voxel_sum(snr) / counts
+        snr_max = np.full(n_voxels, -np.inf)
+        np.maximum.at(snr_max, inverse, snr)
+        out["snr_max"] = snr_max
+    return out
+
+
+def range_azimuth_bins(points, range_resolution, azimuth_resolution_deg, range_max):
+    """Bin points on a polar grid around the sensor.
+
+    Args:
+        points: (N, 4) array of x, y, z, radial velocity
+        range_resolution: Range bin size (meters)
+        azimuth_resolution_deg: Azimuth bin size (degrees)
+        range_max: Points at or beyond this range are dropped
+
+    Returns:
+        Tuple (counts, mean_radial_vel), both (n_range_bins, n_azimuth_bins)
+        with azimuth bins covering -180..180 degrees; empty cells are NaN in
+        mean_radial_vel
+    """
+    points = np.asarray(points)
+    n_range = int(np.ceil(range_max / range_resolution))
+    n_azimuth = int(np.ceil(360.0 / azimuth_resolution_deg))
+
+    ranges = np.linalg.norm(points[:, :3], axis=1)
+    azimuth = np.degrees(np.arctan2(points[:, 1], points[:, 0]))
+    keep = ranges < range_max
+    r_bin = (ranges[keep] / range_resolution).astype(np.int64)
+    a_bin = ((azimuth[keep] + 180.0) / azimuth_resolution_deg).astype(np.int64)
+    # azimuth == 180 exactly would land one past the last bin.
+    np.minimum(a_bin, n_azimuth - 1, out=a_bin)
+    flat = r_bin * n_azimuth + a_bin
+
+    size = n_range * n_azimuth
+    counts = np.bincount(flat, minlength=size)
+    vel_sum = np.bincount(flat, weights=points[keep, 3], minlength=size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_vel = vel_sum / counts
+    return counts.reshape(n_range, n_azimuth), mean_vel.reshape(n_range, n_azimuth)
+
+
+class OccupancyGrid:
+    """2-D x/y grid of hit counts accumulated over many frames."""
+
+    def __init__(self, x_range, y_range, resolution):
+        """
+        Args:
+            x_range: (xmin, xmax) extent of the grid (meters)
+            y_range: (ymin, ymax) extent of the grid (meters)
+            resolution: Cell size (meters)
+        """
+        self.origin = np.array([x_range[0], y_range[0]], dtype=np.float64)
+        self.resolution = resolution
+        self.shape = (
+            int(np.ceil((x_range[1] - x_range[0]) / resolution)),
+            int(np.ceil((y_range[1] - y_range[0]) / resolution)),
+        )
+        self.hits = np.zeros(self.shape, dtype=np.uint32)
+        self.frames = 0
+
+    def add(self, points):
+        """Count every point falling inside the grid; returns the number counted."""
+        cells = np.floor(
+            (np.asarray(points)[:, :2] - self.origin) / self.resolution
+        ).astype(np.int64)
+        inside = (
+            (cells[:, 0] >= 0)
+            & (cells[:, 0] < self.shape[0])
+            & (cells[:, 1] >= 0)
+            & (cells[:, 1] < self.shape[1])
+        )
+        cells = cells[inside]
+        flat = np.ravel_multi_index(cells.T, self.shape)
+        self.hits += (
+            np.bincount(flat, minlength=self.hits.size)
+            .reshape(self.shape)
+            .astype(np.uint32)
+        )
+        self.frames += 1
+        return len(cells)
+
+    def occupied(self, min_hits=1):
+        """Boolean mask of cells hit at least min_hits times."""
+        return self.hits >= min_hits
+
+
+def main():
+    init_voyant_logging()
+    args = parse_args()
+
+    grid = OccupancyGrid(
+        (-args.range_max, args.range_max),
+        (-args.range_max, args.range_max),
+        args.grid_resolution,
+    )
+
+    def reduce_batch(batch):
+        points, snr = frame_points(batch)
+        voxels = voxel_downsample(points, args.voxel_size, snr=snr)
+        counts, _ = range_azimuth_bins(
+            points, args.range_resolution, args.azimuth_resolution, args.range_max
+        )
+        grid.add(points)
+        moving = np.count_nonzero(np.abs(voxels["radial_vel_mean"]) > 0.5)
+        print(
+            f"Frames {batch[0].frame_index}..{batch[-1].frame_index}: "
+            f"{len(points)} points -> {len(voxels)} voxels ({moving} with "
+            f"|mean radial velocity| > 0.5 m/s), "
+            f"{np.count_nonzero(counts)} occupied polar cells"
+        )
+
+        ###############################################
+        # Insert your point cloud processing magic here
+        ###############################################
+
+    batch = []
+    with VoyantPlayback() as playback:
+        playback.open(args.input)
+        for frame in playback:
+            if frame is None:
+                break
+            batch.append(frame)
+            if len(batch) == args.batch_frames:
+                reduce_batch(batch)
+                batch = []
+        if batch:
+            reduce_batch(batch)
+
+    print(
+        f"\nOccupancy grid: {np.count_nonzero(grid.occupied())} of {grid.hits.size} "
+        f"cells hit over {grid.frames} batches"
+    )
+
+
+if __name__ == "__main__":
+    main()